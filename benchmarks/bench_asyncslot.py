@@ -0,0 +1,46 @@
+"""Benchmark asyncslot() creation with cold and warm caches.
+
+Wraps a bound method of each of 10000 receivers.  The cold run clears
+the parameter count and wrapper class caches before every call, which is
+what each call cost before these caches existed; the warm run leaves
+them populated, as when the same methods are wrapped over and over.
+
+Usage: QTINTERBINDING=PySide6 PYTHONPATH=src python benchmarks/bench_asyncslot.py
+"""
+
+import time
+import qtinter
+from qtinter import _helpers
+from qtinter.bindings import QtCore
+
+
+WRAPPERS = 10000
+
+
+class Row:
+    async def clicked(self, checked):
+        pass
+
+
+def run(name, cold):
+    rows = [Row() for _ in range(WRAPPERS)]
+    wrappers = []
+    t0 = time.perf_counter()
+    for row in rows:
+        if cold:
+            _helpers._parameter_counts.clear()
+            _helpers._wrapper_classes.clear()
+        wrappers.append(qtinter.asyncslot(row.clicked))
+    elapsed = time.perf_counter() - t0
+    print(f"{name:<24}{elapsed / WRAPPERS * 1e6:10.2f} us/asyncslot")
+
+
+def main():
+    app = QtCore.QCoreApplication([])
+    run("cold", True)
+    run("warm", False)
+    del app
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Benchmark feeding a burst of signal emissions to a coroutine handler.
+
+Emits a signal 20000 times in a burst, as typing or dragging does with
+textChanged or valueChanged, once with an asyncslot connected directly,
+which starts a task per emission, and once through debounce() and
+throttle(), which only let a few emissions through.
+
+Usage: QTINTERBINDING=PySide6 PYTHONPATH=src python benchmarks/bench_debounce.py
+"""
+
+import asyncio
+import time
+import qtinter
+from qtinter.bindings import QtCore
+
+
+EMISSIONS = 20000
+MS = 50
+
+Signal = getattr(QtCore, "pyqtSignal", None) or QtCore.Signal
+
+
+class Editor(QtCore.QObject):
+    valueChanged = Signal(int)
+
+
+async def run(name, limit):
+    editor = Editor()
+    calls = 0
+
+    async def handler(value):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+
+    signal = limit(editor.valueChanged)
+    signal.connect(qtinter.asyncslot(handler))
+    t0 = time.perf_counter()
+    for i in range(EMISSIONS):
+        editor.valueChanged.emit(i)
+    await asyncio.sleep(0)
+    elapsed = time.perf_counter() - t0
+    await asyncio.sleep(MS * 3 / 1000)
+    print(f"{name:<12}{elapsed / EMISSIONS * 1e6:10.2f} us/emission"
+          f"{calls:8d} handler calls")
+
+
+async def main_async():
+    await run("direct", lambda signal: signal)
+    await run("debounce", lambda signal: qtinter.debounce(signal, MS))
+    await run("throttle", lambda signal: qtinter.throttle(signal, MS))
+
+
+def main():
+    app = QtCore.QCoreApplication([])
+    with qtinter.using_qt_from_asyncio():
+        asyncio.run(main_async())
+    del app
+
+
+if __name__ == "__main__":
+    main()
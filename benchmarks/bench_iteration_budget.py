@@ -0,0 +1,49 @@
+"""Benchmark callback throughput for different iteration budgets.
+
+A chain of callbacks, each scheduling the next with call_soon(), forces
+one loop iteration per callback.  With a zero budget (the default) every
+iteration costs a round trip through the Qt event queue; a positive
+budget runs consecutive iterations within a single Qt notification.
+
+Usage: QTINTERBINDING=PySide6 PYTHONPATH=src python benchmarks/bench_iteration_budget.py
+"""
+
+import asyncio
+import time
+import qtinter
+from qtinter.bindings import QtCore
+
+
+CALLBACKS = 100000
+
+
+def run(name, loop, budget=None):
+    remaining = CALLBACKS
+
+    def step():
+        nonlocal remaining
+        remaining -= 1
+        if remaining:
+            loop.call_soon(step)
+        else:
+            loop.stop()
+
+    if budget is not None:
+        loop.set_iteration_budget(budget)
+    loop.call_soon(step)
+    t0 = time.perf_counter()
+    loop.run_forever()
+    elapsed = time.perf_counter() - t0
+    loop.close()
+    print(f"{name:<28}{CALLBACKS / elapsed:12.0f} callbacks/s")
+
+
+def main():
+    app = QtCore.QCoreApplication([])
+    run("asyncio (native)", asyncio.SelectorEventLoop())
+    for budget in (0, 0.001, 0.01, 0.1):
+        run(f"budget = {budget * 1000:g} ms", qtinter.new_event_loop(), budget)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Benchmark connecting a multisignal with many signals.
+
+Connects a bound method to a multisignal of 200 signals, as for a form
+with many editors, 50 times over, and reports the connect time and the
+Python memory allocated per connection (C++ memory of QObjects is not
+counted), as well as the cost of dispatching an emission.
+
+Usage: QTINTERBINDING=PySide6 PYTHONPATH=src python benchmarks/bench_multisignal.py
+"""
+
+import gc
+import time
+import tracemalloc
+import qtinter
+from qtinter.bindings import QtCore
+
+
+SIGNALS = 200
+CONNECTS = 50
+EMISSIONS = 100000
+
+Signal = getattr(QtCore, "pyqtSignal", None) or QtCore.Signal
+
+
+class Editor(QtCore.QObject):
+    edited = Signal(int)
+
+
+class Form:
+    def on_edited(self, tag, args):
+        pass
+
+
+def main():
+    app = QtCore.QCoreApplication([])
+    editors = [Editor() for _ in range(SIGNALS)]
+    ms = qtinter.multisignal(
+        {editor.edited: f"field{i}" for i, editor in enumerate(editors)})
+    forms = [Form() for _ in range(CONNECTS)]
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    t0 = time.perf_counter()
+    for form in forms:
+        ms.connect(form.on_edited)
+    elapsed = time.perf_counter() - t0
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"{'connect':<12}{elapsed / CONNECTS * 1e3:10.2f} ms/connect")
+    print(f"{'memory':<12}{(after - before) / CONNECTS / 1024:10.1f} KiB/connect")
+
+    del forms
+    gc.collect()
+    ms.connect(Form().on_edited)
+    form = Form()
+    ms.connect(form.on_edited)
+    signal = editors[SIGNALS // 2].edited
+    t0 = time.perf_counter()
+    for i in range(EMISSIONS):
+        signal.emit(i)
+    elapsed = time.perf_counter() - t0
+    print(f"{'emit':<12}{elapsed / EMISSIONS * 1e6:10.2f} us/emission")
+    del app
+
+
+if __name__ == "__main__":
+    main()
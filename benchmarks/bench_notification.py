@@ -0,0 +1,78 @@
+"""Benchmark the number of notifications per second delivered through
+the Qt event loop.
+
+Compares qtinter.bindings._QiObjectImpl, which coalesces notifications
+and posts an event when a non-default priority is set, with the plain
+QTimer.timeout-based implementation it replaced.  Each callback requests
+the next notification BURST times, as if several parties (e.g. the loop
+and the selector's worker thread) asked for the same wakeup.
+
+Usage: QTINTERBINDING=PySide6 PYTHONPATH=src python benchmarks/bench_notification.py
+"""
+
+import time
+from qtinter.bindings import QtCore, _QiObjectImpl
+
+
+NOTIFICATIONS = 100000
+BURST = 4
+
+
+class _QiTimerObjectImpl:
+    """The previous implementation, which reuses QTimer.timeout as a
+    queued signal."""
+
+    def __init__(self):
+        self._timer = QtCore.QTimer()
+
+    def add_callback(self, callback):
+        self._timer.timeout.connect(
+            callback, QtCore.Qt.ConnectionType.QueuedConnection)
+
+    def remove_callback(self, callback):
+        self._timer.timeout.disconnect(callback)
+
+    def invoke_callbacks(self):
+        self._timer.timeout.emit()
+
+
+def run(name, impl, burst):
+    qt_loop = QtCore.QEventLoop()
+    remaining = NOTIFICATIONS
+    calls = 0
+
+    def callback():
+        nonlocal remaining, calls
+        calls += 1
+        remaining -= 1
+        if remaining > 0:
+            for _ in range(burst):
+                impl.invoke_callbacks()
+        elif remaining == 0:
+            QtCore.QTimer.singleShot(0, qt_loop.quit)
+
+    impl.add_callback(callback)
+    impl.invoke_callbacks()
+    t0 = time.perf_counter()
+    if hasattr(qt_loop, 'exec'):
+        qt_loop.exec()
+    else:
+        qt_loop.exec_()
+    elapsed = time.perf_counter() - t0
+    impl.remove_callback(callback)
+    print(f"{name:<28}{burst:6}{NOTIFICATIONS / elapsed:14.0f}"
+          f"{calls:12}")
+
+
+def main():
+    app = QtCore.QCoreApplication([])
+    print(f"{'implementation':<28}{'burst':>6}{'notified/s':>14}"
+          f"{'callbacks':>12}")
+    for burst in (1, BURST):
+        run("QTimer.timeout (previous)", _QiTimerObjectImpl(), burst)
+        run("coalesced (normal)", _QiObjectImpl(), burst)
+        run("coalesced (high, posted)", _QiObjectImpl(1), burst)
+
+
+if __name__ == "__main__":
+    main()
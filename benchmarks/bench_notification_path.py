@@ -0,0 +1,71 @@
+"""Benchmark the per-notification cost of deferred KeyboardInterrupt.
+
+Every Qt notification received by the loop runs a function decorated with
+with_deferred_ki that calls raise_deferred_ki().  The first row times that
+pattern in isolation; the second row times a full loop iteration per
+callback to put it in context.
+
+Usage: QTINTERBINDING=PySide6 PYTHONPATH=src python benchmarks/bench_notification_path.py
+"""
+
+import time
+import qtinter
+from qtinter._ki import (
+    with_deferred_ki, raise_deferred_ki, enable_deferred_ki,
+    disable_deferred_ki,
+)
+from qtinter.bindings import QtCore
+
+
+CALLS = 1000000
+CALLBACKS = 100000
+
+
+@with_deferred_ki
+def notified():
+    raise_deferred_ki()
+
+
+def bench_decorated():
+    installed = enable_deferred_ki()
+    try:
+        t0 = time.perf_counter()
+        for _ in range(CALLS):
+            notified()
+        return (time.perf_counter() - t0) / CALLS
+    finally:
+        if installed:
+            disable_deferred_ki()
+
+
+def bench_iteration():
+    loop = qtinter.new_event_loop()
+    remaining = CALLBACKS
+
+    def step():
+        nonlocal remaining
+        remaining -= 1
+        if remaining:
+            loop.call_soon(step)
+        else:
+            loop.stop()
+
+    loop.call_soon(step)
+    t0 = time.perf_counter()
+    loop.run_forever()
+    elapsed = time.perf_counter() - t0
+    loop.close()
+    return elapsed / CALLBACKS
+
+
+def main():
+    app = QtCore.QCoreApplication([])
+    print(f"{'with_deferred_ki call':<28}"
+          f"{bench_decorated() * 1e9:10.1f} ns/call")
+    print(f"{'loop iteration':<28}"
+          f"{bench_iteration() * 1e9:10.1f} ns/iteration")
+    del app
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark registering sockets with the loop from interleaved code.
+
+Each of 1000 firings of a zero-interval QTimer adds a reader for one
+socket, and the next 1000 firings remove them again.  In between, the
+loop goes back to select() in its worker thread, so each registration
+change arrives while that select() is in flight.  The time spent inside
+each slot is the time the GUI thread is stalled.
+
+Usage: QTINTERBINDING=PySide6 PYTHONPATH=src python benchmarks/bench_register.py
+"""
+
+import asyncio
+import socket
+import time
+import qtinter
+from qtinter.bindings import QtCore
+
+
+SOCKETS = 1000
+
+
+async def churn():
+    loop = asyncio.get_running_loop()
+
+    # Keep a socket registered besides the self-pipe, so that the loop
+    # waits in select() on its worker thread.
+    rsock, wsock = socket.socketpair()
+    loop.add_reader(rsock, lambda: None)
+
+    pairs = [socket.socketpair() for _ in range(SOCKETS // 2)]
+    socks = [sock for pair in pairs for sock in pair]
+    actions = [(loop.add_reader, sock, lambda: None) for sock in socks]
+    actions += [(loop.remove_reader, sock) for sock in socks]
+    stalls = []
+    done = loop.create_future()
+
+    def slot():
+        action, *args = actions[len(stalls)]
+        t0 = time.perf_counter()
+        action(*args)
+        stalls.append(time.perf_counter() - t0)
+        if len(stalls) == len(actions):
+            timer.stop()
+            done.set_result(None)
+
+    timer = QtCore.QTimer()
+    timer.setInterval(0)
+    timer.timeout.connect(slot)
+    t0 = time.perf_counter()
+    timer.start()
+    try:
+        await done
+    finally:
+        elapsed = time.perf_counter() - t0
+        timer.stop()
+        loop.remove_reader(rsock)
+        rsock.close()
+        wsock.close()
+        for sock in socks:
+            sock.close()
+    return elapsed, stalls
+
+
+def main():
+    app = QtCore.QCoreApplication([])
+    loop = qtinter.QiDefaultEventLoop()
+    try:
+        elapsed, stalls = loop.run_until_complete(churn())
+    finally:
+        loop.close()
+    stalls.sort()
+    print(f"registration changes  {len(stalls)}")
+    print(f"total time            {elapsed * 1e3:10.1f} ms")
+    print(f"mean stall per slot   {sum(stalls) / len(stalls) * 1e6:10.1f} us")
+    print(f"median stall          {stalls[len(stalls) // 2] * 1e6:10.1f} us")
+    print(f"max stall             {stalls[-1] * 1e6:10.1f} us")
+    del app
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark slot invocation throughput through run_task().
+
+Calls an asyncslot() wrapper 100000 times with a coroutine that returns
+immediately and with one that yields once, and compares run_task()
+with asyncio.create_task().  On Python 3.12 and above, run_task() uses
+the native eager task start unless the loop has a custom task factory;
+the 'factory' rows force the fallback path for comparison.
+
+Usage: QTINTERBINDING=PySide6 PYTHONPATH=src python benchmarks/bench_run_task.py
+"""
+
+import asyncio
+import sys
+import time
+import qtinter
+from qtinter.bindings import QtCore
+
+
+CALLS = 100000
+
+
+async def immediate():
+    pass
+
+
+async def yield_once():
+    await asyncio.sleep(0)
+
+
+def _task_factory(loop, coro, **kwargs):
+    return asyncio.Task(coro, loop=loop, **kwargs)
+
+
+async def run(name, fn, task_runner, factory=None):
+    loop = asyncio.get_running_loop()
+    loop.set_task_factory(factory)
+    slot = qtinter.asyncslot(fn, task_runner=task_runner)
+    try:
+        t0 = time.perf_counter()
+        tasks = [slot() for _ in range(CALLS)]
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - t0
+    finally:
+        loop.set_task_factory(None)
+    print(f"{name:<32}{elapsed / CALLS * 1e6:10.2f} us/call")
+
+
+async def amain():
+    print(f"Python {sys.version.split()[0]}")
+    for fn in (immediate, yield_once):
+        await run(f"{fn.__name__}, run_task", fn, qtinter.run_task)
+        await run(f"{fn.__name__}, run_task, factory", fn,
+                  qtinter.run_task, _task_factory)
+        await run(f"{fn.__name__}, create_task", fn, asyncio.create_task)
+
+
+def main():
+    app = QtCore.QCoreApplication([])
+    with qtinter.using_qt_from_asyncio():
+        asyncio.run(amain())
+    del app
+
+
+if __name__ == "__main__":
+    main()
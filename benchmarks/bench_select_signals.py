@@ -0,0 +1,67 @@
+"""Benchmark waiting for the first of several signals to emit.
+
+Waits 2000 times for whichever of 3 or 20 signals emits first, once with
+an asyncsignal() task per signal, asyncio.wait(FIRST_COMPLETED) and
+cancellation of the other tasks, and once with select_signals().
+
+Usage: QTINTERBINDING=PySide6 PYTHONPATH=src python benchmarks/bench_select_signals.py
+"""
+
+import asyncio
+import time
+import qtinter
+from qtinter.bindings import QtCore
+
+
+ROUNDS = 2000
+
+Signal = getattr(QtCore, "pyqtSignal", None) or QtCore.Signal
+
+
+class Sender(QtCore.QObject):
+    signal = Signal(int)
+
+
+async def select_with_wait(signal_map):
+    tasks = {asyncio.ensure_future(qtinter.asyncsignal(signal)): tag
+             for signal, tag in signal_map.items()}
+    done, pending = await asyncio.wait(
+        tasks, return_when=asyncio.FIRST_COMPLETED)
+    for task in pending:
+        task.cancel()
+    await asyncio.wait(pending)
+    task = done.pop()
+    return tasks[task], task.result()
+
+
+async def run(name, select, count):
+    senders = [Sender() for _ in range(count)]
+    signal_map = {sender.signal: i for i, sender in enumerate(senders)}
+    t0 = time.perf_counter()
+    for i in range(ROUNDS):
+        task = asyncio.ensure_future(select(signal_map))
+        # Let select() connect to the signals before emitting.
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        senders[i % count].signal.emit(i)
+        assert await task == (i % count, (i,))
+    elapsed = time.perf_counter() - t0
+    print(f"{name:<28}{elapsed / ROUNDS * 1e6:10.1f} us/select")
+
+
+async def main_async():
+    for count in (3, 20):
+        await run(f"asyncio.wait, {count} signals", select_with_wait, count)
+        await run(f"select_signals, {count} signals",
+                  qtinter.select_signals, count)
+
+
+def main():
+    app = QtCore.QCoreApplication([])
+    with qtinter.using_qt_from_asyncio():
+        asyncio.run(main_async())
+    del app
+
+
+if __name__ == "__main__":
+    main()
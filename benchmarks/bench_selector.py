@@ -0,0 +1,70 @@
+"""Benchmark the latency of a blocking loop iteration for each selector.
+
+Each round trip sends one byte to an echo thread and waits for the reply,
+so that every iteration of the loop has to block in select().  The default
+selector offloads the blocking select() to a worker thread; the
+QiSocketNotifierSelector lets the Qt event loop watch the selector's file
+descriptor instead.
+
+Usage: QTINTERBINDING=PySide6 PYTHONPATH=src python benchmarks/bench_selector.py
+"""
+
+import asyncio
+import selectors
+import socket
+import sys
+import threading
+import time
+import qtinter
+from qtinter.bindings import QtCore
+
+
+ROUND_TRIPS = 5000
+
+
+def echo(sock):
+    while True:
+        data = sock.recv(1)
+        if not data:
+            break
+        sock.send(data)
+
+
+async def ping_pong(n):
+    loop = asyncio.get_running_loop()
+    csock, ssock = socket.socketpair()
+    csock.setblocking(False)
+    thread = threading.Thread(target=echo, args=(ssock,))
+    thread.start()
+    try:
+        t0 = time.perf_counter()
+        for _ in range(n):
+            await loop.sock_sendall(csock, b'x')
+            await loop.sock_recv(csock, 1)
+        return time.perf_counter() - t0
+    finally:
+        csock.close()
+        thread.join()
+        ssock.close()
+
+
+def run(name, loop_factory):
+    loop = loop_factory()
+    try:
+        elapsed = loop.run_until_complete(ping_pong(ROUND_TRIPS))
+    finally:
+        loop.close()
+    print(f"{name:<28}{elapsed / ROUND_TRIPS * 1e6:10.1f} us/round trip")
+
+
+def main():
+    app = QtCore.QCoreApplication([])
+    run("asyncio (native)", asyncio.SelectorEventLoop)
+    run("QiSelectorEventLoop", qtinter.QiSelectorEventLoop)
+    if sys.platform != 'win32':
+        run("QiSocketNotifierSelector", lambda: qtinter.QiSelectorEventLoop(
+            qtinter.QiSocketNotifierSelector(selectors.DefaultSelector())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Benchmark signal emissions into asyncsignalstream for typical signatures.
+
+Each emission goes through copy_signal_arguments, which must copy Qt
+value types under PyQt but can pass immutable Python scalars through.
+
+Usage: QTINTERBINDING=PyQt5 PYTHONPATH=src python benchmarks/bench_signal_copy.py
+"""
+
+import asyncio
+import time
+import qtinter
+from qtinter.bindings import QtCore
+
+
+EMISSIONS = 100000
+
+Signal = getattr(QtCore, "pyqtSignal", None) or QtCore.Signal
+
+
+class Sender(QtCore.QObject):
+    int_signal = Signal(int)
+    str_float_signal = Signal(str, float)
+    bool_bytes_signal = Signal(bool, bytes)
+    point_signal = Signal(QtCore.QPoint)
+
+
+CASES = [
+    ("(int)", "int_signal", (1,)),
+    ("(str, float)", "str_float_signal", ("value", 1.5)),
+    ("(bool, bytes)", "bool_bytes_signal", (True, b"data")),
+    ("(QPoint)", "point_signal", (QtCore.QPoint(1, 2),)),
+]
+
+
+async def run(name, signal_name, args):
+    sender = Sender()
+    signal = getattr(sender, signal_name)
+    async with qtinter.asyncsignalstream(signal) as stream:
+        t0 = time.perf_counter()
+        for _ in range(EMISSIONS):
+            signal.emit(*args)
+        elapsed = time.perf_counter() - t0
+        assert len(await stream.batches().__anext__()) == EMISSIONS
+    print(f"{name:<16}{EMISSIONS / elapsed:12.0f} emissions/s")
+
+
+async def main_async():
+    for case in CASES:
+        await run(*case)
+
+
+def main():
+    app = QtCore.QCoreApplication([])
+    with qtinter.using_qt_from_asyncio():
+        asyncio.run(main_async())
+    del app
+
+
+if __name__ == "__main__":
+    main()
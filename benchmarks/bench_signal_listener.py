@@ -0,0 +1,61 @@
+"""Benchmark awaiting the same signal repeatedly.
+
+Awaits 10000 emissions of a signal, once with a fresh asyncsignal() per
+emission, which creates and deletes a slot object and a connection each
+time, and once with a SignalListener that stays connected.
+
+Usage: QTINTERBINDING=PySide6 PYTHONPATH=src python benchmarks/bench_signal_listener.py
+"""
+
+import asyncio
+import time
+import qtinter
+from qtinter.bindings import QtCore
+
+
+EMISSIONS = 10000
+
+Signal = getattr(QtCore, "pyqtSignal", None) or QtCore.Signal
+
+
+class Sender(QtCore.QObject):
+    signal = Signal(int)
+
+
+async def wait_asyncsignal(sender):
+    loop = asyncio.get_running_loop()
+    for i in range(EMISSIONS):
+        loop.call_soon(sender.signal.emit, i)
+        await qtinter.asyncsignal(sender.signal)
+
+
+async def wait_listener(sender):
+    loop = asyncio.get_running_loop()
+    with qtinter.SignalListener(sender.signal) as listener:
+        for i in range(EMISSIONS):
+            loop.call_soon(sender.signal.emit, i)
+            await listener.wait()
+
+
+async def run(name, wait):
+    sender = Sender()
+    t0 = time.perf_counter()
+    await wait(sender)
+    elapsed = time.perf_counter() - t0
+    print(f"{name:<20}{elapsed / EMISSIONS * 1e6:10.2f} us/wait")
+
+
+async def main_async():
+    await run("asyncsignal", wait_asyncsignal)
+    await run("SignalListener", wait_listener)
+
+
+def main():
+    app = QtCore.QCoreApplication([])
+    with qtinter.using_qt_from_asyncio():
+        asyncio.run(main_async())
+    del app
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark filtering a chatty signal with asyncsignal(predicate=...).
+
+Waits for the one emission out of 1000 that matters, once by awaiting
+asyncsignal() in a loop and checking the arguments in the task, and
+once by passing the check as predicate, which runs in the slot before
+the arguments are copied or the task is woken up.
+
+Usage: QTINTERBINDING=PySide6 PYTHONPATH=src python benchmarks/bench_signal_predicate.py
+"""
+
+import asyncio
+import time
+import qtinter
+from qtinter.bindings import QtCore
+
+
+EMISSIONS = 1000
+ROUNDS = 20
+
+Signal = getattr(QtCore, "pyqtSignal", None) or QtCore.Signal
+
+
+class Sender(QtCore.QObject):
+    signal = Signal(int)
+
+
+async def emit_all(sender):
+    for i in range(EMISSIONS):
+        sender.signal.emit(i)
+        await asyncio.sleep(0)
+
+
+async def wait_in_task(sender):
+    while True:
+        (value,) = await qtinter.asyncsignal(sender.signal)
+        if value == EMISSIONS - 1:
+            return
+
+
+async def wait_with_predicate(sender):
+    await qtinter.asyncsignal(sender.signal,
+                              predicate=lambda value: value == EMISSIONS - 1)
+
+
+async def run(name, wait):
+    sender = Sender()
+    t0 = time.perf_counter()
+    for _ in range(ROUNDS):
+        waiter = asyncio.create_task(wait(sender))
+        await asyncio.sleep(0)
+        await emit_all(sender)
+        await waiter
+    elapsed = time.perf_counter() - t0
+    print(f"{name:<24}{elapsed / ROUNDS * 1e3:10.2f} ms/round")
+
+
+async def main_async():
+    await run("check in task", wait_in_task)
+    await run("predicate", wait_with_predicate)
+
+
+def main():
+    app = QtCore.QCoreApplication([])
+    with qtinter.using_qt_from_asyncio():
+        asyncio.run(main_async())
+    del app
+
+
+if __name__ == "__main__":
+    main()
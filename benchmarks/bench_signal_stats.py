@@ -0,0 +1,57 @@
+"""Benchmark the overhead of signal and slot statistics.
+
+Emits a signal connected to an asyncslot() wrapper and to an
+asyncsignalstream 100000 times, with and without a QiSignalStats
+object installed, and prints the summary collected.
+
+Usage: QTINTERBINDING=PySide6 PYTHONPATH=src python benchmarks/bench_signal_stats.py
+"""
+
+import asyncio
+import time
+import qtinter
+from qtinter.bindings import QtCore
+
+
+EMISSIONS = 100000
+
+
+class Receiver:
+    async def handle(self):
+        pass
+
+
+async def run(name, stats):
+    timer = QtCore.QTimer()
+    receiver = Receiver()
+    timer.timeout.connect(qtinter.asyncslot(receiver.handle))
+    stream = qtinter.asyncsignalstream(timer.timeout, maxsize=100)
+    qtinter.set_signal_stats(stats)
+    try:
+        t0 = time.perf_counter()
+        for _ in range(EMISSIONS):
+            timer.timeout.emit()
+        elapsed = time.perf_counter() - t0
+    finally:
+        qtinter.set_signal_stats(None)
+    stream.close()
+    print(f"{name:<24}{elapsed / EMISSIONS * 1e6:10.2f} us/emission")
+
+
+async def amain():
+    stats = qtinter.QiSignalStats()
+    await run("disabled", None)
+    await run("enabled", stats)
+    await asyncio.sleep(0.1)  # let done callbacks of the tasks run
+    print(stats.summary())
+
+
+def main():
+    app = QtCore.QCoreApplication([])
+    with qtinter.using_qt_from_asyncio():
+        asyncio.run(amain())
+    del app
+
+
+if __name__ == "__main__":
+    main()
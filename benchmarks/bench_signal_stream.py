@@ -0,0 +1,65 @@
+"""Benchmark draining a backlog of signal emissions from asyncsignalstream.
+
+Emits a signal 50000 times before consuming the stream, once item by
+item and once in batches.
+
+Usage: QTINTERBINDING=PySide6 PYTHONPATH=src python benchmarks/bench_signal_stream.py
+"""
+
+import asyncio
+import time
+import qtinter
+from qtinter.bindings import QtCore
+
+
+EMISSIONS = 50000
+
+
+class Sender(QtCore.QObject):
+    if hasattr(QtCore, "pyqtSignal"):
+        signal = QtCore.pyqtSignal(int)
+    else:
+        signal = QtCore.Signal(int)
+
+
+async def drain_items(stream):
+    n = 0
+    async for _ in stream:
+        n += 1
+        if n == EMISSIONS:
+            break
+
+
+async def drain_batches(stream):
+    n = 0
+    async for batch in stream.batches():
+        n += len(batch)
+        if n == EMISSIONS:
+            break
+
+
+async def run(name, drain):
+    sender = Sender()
+    stream = qtinter.asyncsignalstream(sender.signal)
+    for i in range(EMISSIONS):
+        sender.signal.emit(i)
+    t0 = time.perf_counter()
+    await drain(stream)
+    elapsed = time.perf_counter() - t0
+    print(f"{name:<16}{EMISSIONS / elapsed:14.0f} emissions/s")
+
+
+async def main_async():
+    await run("item by item", drain_items)
+    await run("batches()", drain_batches)
+
+
+def main():
+    app = QtCore.QCoreApplication([])
+    with qtinter.using_qt_from_asyncio():
+        asyncio.run(main_async())
+    del app
+
+
+if __name__ == "__main__":
+    main()
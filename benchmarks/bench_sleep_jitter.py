@@ -0,0 +1,73 @@
+"""Benchmark the accuracy of asyncio.sleep() in each loop mode.
+
+For each interval, asyncio.sleep() is called repeatedly and the actual
+elapsed time is compared with the requested interval.  The mean and the
+maximum overshoot are reported in milliseconds.
+
+Usage: QTINTERBINDING=PySide6 PYTHONPATH=src python benchmarks/bench_sleep_jitter.py
+"""
+
+import asyncio
+import statistics
+import time
+import qtinter
+from qtinter.bindings import QtCore
+
+
+# (interval in seconds, number of samples)
+INTERVALS = [(0.001, 500), (0.01, 100), (0.1, 20)]
+
+
+async def measure(interval, samples):
+    overshoots = []
+    for _ in range(samples):
+        t0 = time.perf_counter()
+        await asyncio.sleep(interval)
+        overshoots.append(time.perf_counter() - t0 - interval)
+    return overshoots
+
+
+def run_owner(interval, samples):
+    loop = qtinter.new_event_loop()
+    try:
+        return loop.run_until_complete(measure(interval, samples))
+    finally:
+        loop.close()
+
+
+def run_guest(interval, samples):
+    qt_loop = QtCore.QEventLoop()
+    with qtinter.using_asyncio_from_qt():
+        task = asyncio.ensure_future(measure(interval, samples))
+        task.add_done_callback(lambda _: qt_loop.quit())
+        if hasattr(qt_loop, 'exec'):
+            qt_loop.exec()
+        else:
+            qt_loop.exec_()
+        return task.result()
+
+
+def run_native(interval, samples):
+    loop = qtinter.new_event_loop()
+    loop.set_mode(qtinter.QiLoopMode.NATIVE)
+    try:
+        return loop.run_until_complete(measure(interval, samples))
+    finally:
+        loop.close()
+
+
+def main():
+    app = QtCore.QCoreApplication([])
+    print(f"{'mode':<8}{'interval':>10}{'mean':>10}{'max':>10}  (ms)")
+    for name, runner in [("OWNER", run_owner),
+                         ("GUEST", run_guest),
+                         ("NATIVE", run_native)]:
+        for interval, samples in INTERVALS:
+            overshoots = runner(interval, samples)
+            print(f"{name:<8}{interval * 1000:10g}"
+                  f"{statistics.mean(overshoots) * 1000:10.3f}"
+                  f"{max(overshoots) * 1000:10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark a burst of emissions delivered to asyncslot() policies.
+
+Emits a signal 1000 times in a row, each emission connected to a slot
+that sleeps for 10 ms, and reports the time until all tasks complete
+and the peak number of slot coroutines running at once.  (A task
+cancelled by 'restart' counts as running until it is cancelled.)  Without a policy every
+emission starts its own task; with a policy the number of concurrent
+tasks is bounded.
+
+Usage: QTINTERBINDING=PySide6 PYTHONPATH=src python benchmarks/bench_slot_policy.py
+"""
+
+import asyncio
+import time
+import qtinter
+from qtinter.bindings import QtCore
+
+
+EMISSIONS = 1000
+
+
+class Worker:
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+        self.finished = 0
+
+    async def work(self):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(0.01)
+            self.finished += 1
+        finally:
+            self.running -= 1
+
+
+async def run(name, **kwargs):
+    timer = QtCore.QTimer()
+    worker = Worker()
+    timer.timeout.connect(qtinter.asyncslot(worker.work, **kwargs))
+    t0 = time.perf_counter()
+    for _ in range(EMISSIONS):
+        timer.timeout.emit()
+    # Two idle checks in a row let done callbacks start queued calls.
+    idle = 0
+    while idle < 2:
+        await asyncio.sleep(0.001)
+        idle = 0 if len(asyncio.all_tasks()) > 1 else idle + 1
+    elapsed = time.perf_counter() - t0
+    print(f"{name:<24}{elapsed * 1e3:10.1f} ms"
+          f"{worker.max_running:8d} peak{worker.finished:8d} finished")
+
+
+async def amain():
+    await run("no policy")
+    await run("drop_while_running", policy='drop_while_running')
+    await run("restart", policy='restart')
+    await run("queue, N=8, max 64", policy='queue', max_concurrency=8,
+              max_queued=64)
+
+
+def main():
+    app = QtCore.QCoreApplication([])
+    with qtinter.using_qt_from_asyncio():
+        asyncio.run(amain())
+    del app
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Benchmark cancelling the tasks of a TaskScope when its QObject dies.
+
+Starts 10000 slot tasks that wait for a long time, as when a heavy
+panel has many requests in flight, then deletes the QObject owning
+the scope and reports the time taken to cancel the tasks and for all
+of them to complete.
+
+Usage: QTINTERBINDING=PySide6 PYTHONPATH=src python benchmarks/bench_task_scope.py
+"""
+
+import asyncio
+import time
+import qtinter
+from qtinter.bindings import QtCore
+
+
+TASKS = 10000
+
+
+async def request():
+    await asyncio.sleep(3600)
+
+
+async def amain():
+    panel = QtCore.QObject()
+    scope = qtinter.TaskScope(panel)
+    slot = qtinter.asyncslot(request, scope=scope)
+    t0 = time.perf_counter()
+    tasks = [slot() for _ in range(TASKS)]
+    t1 = time.perf_counter()
+    del panel
+    t2 = time.perf_counter()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    t3 = time.perf_counter()
+    print(f"{'start':<24}{(t1 - t0) / TASKS * 1e6:10.2f} us/task")
+    print(f"{'cancel':<24}{(t2 - t1) * 1e3:10.2f} ms")
+    print(f"{'complete':<24}{(t3 - t2) * 1e3:10.2f} ms")
+    print(f"{'cancelled':<24}{scope.cancelled:10d} tasks")
+
+
+def main():
+    app = QtCore.QCoreApplication([])
+    with qtinter.using_qt_from_asyncio():
+        asyncio.run(amain())
+    del app
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Benchmark creating slot wrappers for bound methods.
+
+Wraps a bound method of each of 10000 receivers, as when connecting a
+slot for every row of a large view, and then wraps the method of a
+single receiver 10000 times while the wrappers are kept alive.
+
+Usage: QTINTERBINDING=PySide6 PYTHONPATH=src python benchmarks/bench_wrappers.py
+"""
+
+import time
+import qtinter
+from qtinter._helpers import transform_slot
+from qtinter.bindings import QtCore
+
+
+WRAPPERS = 10000
+
+
+class Row:
+    async def clicked(self):
+        pass
+
+
+def _transform(slot, args):
+    pass
+
+
+def run(name, make):
+    rows = [Row() for _ in range(WRAPPERS)]
+    t0 = time.perf_counter()
+    wrappers = make(rows)
+    elapsed = time.perf_counter() - t0
+    assert len(wrappers) == WRAPPERS
+    print(f"{name:<36}{elapsed / WRAPPERS * 1e6:10.2f} us/wrapper")
+
+
+def main():
+    app = QtCore.QCoreApplication([])
+    run("transform_slot, distinct receivers",
+        lambda rows: [transform_slot(row.clicked, _transform) for row in rows])
+    run("asyncslot, distinct receivers",
+        lambda rows: [qtinter.asyncslot(row.clicked) for row in rows])
+    run("asyncslot, same receiver",
+        lambda rows: [qtinter.asyncslot(rows[0].clicked) for _ in rows])
+    del app
+
+
+if __name__ == "__main__":
+    main()
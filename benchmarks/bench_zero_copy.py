@@ -0,0 +1,56 @@
+"""Benchmark streaming QByteArray payloads to an asyncio consumer.
+
+Emits 200 payloads of 4 MiB, each a fresh QByteArray as returned by
+QIODevice.readAll(), and consumes them from asyncsignalstream, once by
+converting each payload to bytes and once with zero_copy=True, which
+delivers a memoryview over the retained QByteArray.
+
+Usage: QTINTERBINDING=PySide6 PYTHONPATH=src python benchmarks/bench_zero_copy.py
+"""
+
+import asyncio
+import time
+import qtinter
+from qtinter.bindings import QtCore
+
+
+PAYLOADS = 200
+PAYLOAD_SIZE = 4 * 1024 * 1024
+
+Signal = getattr(QtCore, "pyqtSignal", None) or QtCore.Signal
+
+
+class Instrument(QtCore.QObject):
+    dataReceived = Signal(QtCore.QByteArray)
+
+
+async def run(name, zero_copy, to_buffer):
+    instrument = Instrument()
+    source = b"x" * PAYLOAD_SIZE
+    total = 0
+    t0 = time.perf_counter()
+    async with qtinter.asyncsignalstream(instrument.dataReceived,
+                                         zero_copy=zero_copy) as stream:
+        for _ in range(PAYLOADS):
+            instrument.dataReceived.emit(QtCore.QByteArray(source))
+            (payload,) = await stream.__anext__()
+            total += len(to_buffer(payload))
+    elapsed = time.perf_counter() - t0
+    assert total == PAYLOADS * PAYLOAD_SIZE
+    print(f"{name:<20}{total / elapsed / 2 ** 20:10.0f} MiB/s")
+
+
+async def main_async():
+    await run("bytes(payload)", False, bytes)
+    await run("zero_copy=True", True, memoryview)
+
+
+def main():
+    app = QtCore.QCoreApplication([])
+    with qtinter.using_qt_from_asyncio():
+        asyncio.run(main_async())
+    del app
+
+
+if __name__ == "__main__":
+    main()
@@ -48,6 +48,7 @@ from ._signals import *
 from ._slots import *
 from ._modal import *
 from ._contexts import *
+from ._stats import *
 from ._tasks import *
 
 
@@ -59,6 +60,7 @@ __all__ = (
     _slots.__all__ +
     _modal.__all__ +
     _contexts.__all__ +
+    _stats.__all__ +
     _tasks.__all__
 )
 
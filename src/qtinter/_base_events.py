@@ -4,10 +4,12 @@ import asyncio
 import enum
 import sys
 import threading
+import time
 from asyncio import events
 from typing import Any, Callable, Optional
 from ._selectable import *
 from ._ki import *
+from ._stats import QiLoopStats
 
 
 __all__ = 'QiBaseEventLoop', 'QiLoopMode',
@@ -30,6 +32,13 @@ class _QiNotifierImpl(_QiNotifier):
         self._qi_object = qi_object
         self._qi_object.add_callback(self._on_notified)
 
+        # Statistics to update, or None if not collecting.  The time at
+        # which select() yielded and the time at which the selector then
+        # notified us are recorded only when collecting.
+        self._stats: Optional[QiLoopStats] = None
+        self._select_start_time: Optional[float] = None
+        self._notify_time: Optional[float] = None
+
         # Install a SIGINT handler for deferred KeyboardInterrupt.
         self._signal_handler_installed = enable_deferred_ki()
 
@@ -40,6 +49,11 @@ class _QiNotifierImpl(_QiNotifier):
             # This branch is never run in testing, but is good to have.
             return
 
+        stats = self._stats
+        if stats is not None and self._notify_time is not None:
+            stats.notify_latency.add(time.perf_counter() - self._notify_time)
+            self._notify_time = None
+
         # If Ctrl+C is pressed while the loop is in a 'non-blocking'
         # select(), the select() will be woken up (due to set_wakeup_fd)
         # and the _notified signal emitted.  KeyboardInterrupt will be
@@ -51,10 +65,22 @@ class _QiNotifierImpl(_QiNotifier):
         except BaseException as exc:
             self._loop._qi_loop_interrupt(exc)
 
+    def set_priority(self, priority: int) -> None:
+        self._qi_object.set_priority(priority)
+
     def no_result(self):
+        if self._stats is not None:
+            self._select_start_time = time.perf_counter()
         raise _QiYield
 
     def notify(self):
+        # This method may be called from the selector's worker thread.
+        stats = self._stats
+        if stats is not None and self._select_start_time is not None:
+            now = time.perf_counter()
+            stats.select_time.add(now - self._select_start_time)
+            self._select_start_time = None
+            self._notify_time = now
         self._qi_object.invoke_callbacks()
 
     def wakeup(self):
@@ -70,9 +96,9 @@ class _QiNotifierImpl(_QiNotifier):
             self._signal_handler_installed = False
 
 
-def _create_notifier(loop: "QiBaseEventLoop"):
+def _create_notifier(loop: "QiBaseEventLoop", priority: int):
     from .bindings import _QiObjectImpl
-    return _QiNotifierImpl(loop, _QiObjectImpl())
+    return _QiNotifierImpl(loop, _QiObjectImpl(priority))
 
 
 class QiLoopMode(enum.Enum):
@@ -201,6 +227,23 @@ class QiBaseEventLoop(asyncio.BaseEventLoop):
         # Qt event loops; see qtinter.modal() for usage.
         self.__modal_fn: Optional[Callable[[], Any]] = None
 
+        # Maximum time (in seconds) that _qi_loop_iteration may spend
+        # running consecutive _run_once() iterations before yielding to
+        # the Qt event loop.  Zero means run exactly one iteration.
+        self.__iteration_budget = 0.0
+
+        # Statistics to update, or None if not collecting.
+        self.__stats: Optional[QiLoopStats] = None
+
+        # Priority of the Qt events posted to schedule _qi_loop_iteration.
+        self.__notification_priority = 0
+
+        # Set when _write_to_self() writes to the self-pipe and cleared
+        # after the self-pipe is drained, so that a burst of callbacks
+        # scheduled from interleaved code or other threads writes to the
+        # self-pipe only once.
+        self.__wakeup_pending = False
+
         # Need to invoke base constructor after initializing member variables
         # for compatibility with Python 3.7's BaseProactorEventLoop (Windows),
         # which calls self.call_soon() indirectly from its constructor.
@@ -217,6 +260,40 @@ class QiBaseEventLoop(asyncio.BaseEventLoop):
             raise RuntimeError('cannot call set_mode when the loop is stopping')
         self.__mode = mode
 
+    def set_iteration_budget(self, budget: float) -> None:
+        """Set the maximum time (in seconds) to keep running asyncio
+        iterations per Qt notification before yielding to the Qt event
+        loop.  Zero (the default) runs exactly one iteration."""
+        if budget < 0:
+            raise ValueError('iteration budget must be non-negative')
+        self.__iteration_budget = budget
+
+    def get_iteration_budget(self) -> float:
+        return self.__iteration_budget
+
+    def set_notification_priority(self, priority: int) -> None:
+        """Set the priority of the Qt events posted to run asyncio
+        iterations, e.g. Qt.EventPriority.HighEventPriority.  The default
+        is Qt.EventPriority.NormalEventPriority (zero)."""
+        # Accept members of Qt.EventPriority as well as plain integers.
+        priority = int(getattr(priority, 'value', priority))
+        self.__notification_priority = priority
+        if self.__notifier is not None:
+            self.__notifier.set_priority(priority)
+
+    def get_notification_priority(self) -> int:
+        return self.__notification_priority
+
+    def set_stats(self, stats: Optional[QiLoopStats]) -> None:
+        """Start collecting statistics into stats, or stop collecting
+        if stats is None."""
+        self.__stats = stats
+        if self.__notifier is not None:
+            self.__notifier._stats = stats
+
+    def get_stats(self) -> Optional[QiLoopStats]:
+        return self.__stats
+
     def exec_modal(self, modal_fn: Callable[[], Any]) -> None:
         """Schedule modal_fn to be called immediately after the current
         callback completes.  modal_fn will be called as if it were
@@ -265,7 +342,9 @@ class QiBaseEventLoop(asyncio.BaseEventLoop):
 
         self.__old_agen_hooks = old_agen_hooks
 
-        self.__notifier = _create_notifier(self)
+        self.__notifier = _create_notifier(
+            self, self.__notification_priority)
+        self.__notifier._stats = self.__stats
         self.__notifier.notify()  # schedule initial _run_once
 
         if not hasattr(self._selector, "set_notifier"):  # pragma: no cover
@@ -308,28 +387,44 @@ class QiBaseEventLoop(asyncio.BaseEventLoop):
         assert not self.is_closed(), 'loop unexpectedly closed'
         assert self.is_running(), 'loop unexpectedly stopped'
 
+        stats = self.__stats
+        if stats is not None:
+            stats.iterations += 1
+
         # Process ready callbacks, ready IO, and scheduled callbacks that
-        # have passed the schedule time.  Run only once to avoid starving
-        # the Qt event loop.
-        try:
-            self.__processing = True
-            try:
-                self._run_once()
-            except _QiIterationExit:  # early exit is not an error
-                pass
-            finally:
-                self.__processing = False
-        except _QiYield:
-            # Ignore _stopping flag until select() returns.  This follows
-            # asyncio behavior.
-            # TODO: but this should not happen, because 0 timeout is passed
-            # TODO: to select() if _stopping is True.
-            pass
-        except BaseException:
-            # Other BaseExceptions, notably KeyboardInterrupt and SystemExit,
-            # are propagated to the caller (_on_notified) to handle.
-            raise
+        # have passed the schedule time.  Run only once (or until the
+        # iteration budget is used up) to avoid starving the Qt event loop.
+        if self.__iteration_budget > 0:
+            end_time = self.time() + self.__iteration_budget
         else:
+            end_time = None
+
+        while True:
+            if stats is not None:
+                stats.ready_depth.add(len(self._ready))
+
+            try:
+                self.__processing = True
+                try:
+                    self._run_once()
+                except _QiIterationExit:  # early exit is not an error
+                    pass
+                finally:
+                    self.__processing = False
+            except _QiYield:
+                # Ignore _stopping flag until select() returns.  This follows
+                # asyncio behavior.
+                # TODO: but this should not happen, because 0 timeout is passed
+                # TODO: to select() if _stopping is True.
+                if stats is not None:
+                    stats.yields += 1
+                return
+            except BaseException:
+                # Other BaseExceptions, notably KeyboardInterrupt and
+                # SystemExit, are propagated to the caller (_on_notified)
+                # to handle.
+                raise
+
             # If a modal_fn is scheduled, the iteration is considered
             # interrupted in order to execute modal_fn out of the
             # iteration's context (i.e. not as a callback).
@@ -369,9 +464,13 @@ class QiBaseEventLoop(asyncio.BaseEventLoop):
                     # In GUEST mode, stop immediately because there is
                     # no 'caller' to perform the cleanup for us.
                     self._qi_loop_cleanup()
-            else:
-                # Schedule next iteration if this iteration did not block
+                return
+
+            # Schedule next iteration if this iteration did not block and
+            # the budget is used up; otherwise run the next iteration now.
+            if end_time is None or self.time() >= end_time:
                 self.__notifier.notify()
+                return
 
     def _qi_loop_interrupt(self, exc: BaseException):
         """Terminate the loop abnormally with the given exception.
@@ -672,5 +771,39 @@ class QiBaseEventLoop(asyncio.BaseEventLoop):
     # _make_read_pipe_transport: see _UnixSelectorEventLoop
     # _make_write_pipe_transport: see _UnixSelectorEventLoop
     # _make_subprocess_transport: see _UnixSelectorEventLoop
-    # _write_to_self: see BaseSelectorEventLoop / BaseProactorEventLoop
+
+    def _write_to_self(self):
+        # This method may be called from any thread.  If a previous write
+        # has not yet been drained, the selector is already going to wake
+        # up (or has woken up and not yet drained it), and any callback
+        # scheduled since then is already in the ready queue and will be
+        # run by a subsequent _run_once(), so skip the syscall.
+        if self.__wakeup_pending:
+            return
+        self.__wakeup_pending = True
+        stats = self.__stats
+        if stats is not None:
+            stats.wakeups += 1
+        super()._write_to_self()
+
     # _process_events: see BaseSelectorEventLoop / BaseProactorEventLoop
+
+    # The pending flag must be cleared only after the self-pipe is
+    # drained: if it were cleared before, a byte written in between would
+    # be drained with the flag set again, and every later wakeup skipped.
+    # A callback whose write is skipped while the pipe is being drained is
+    # already in the ready queue, so the next select() does not block.
+
+    def _read_from_self(self):
+        # Called by BaseSelectorEventLoop to drain the self-pipe.
+        try:
+            return super()._read_from_self()  # noqa
+        finally:
+            self.__wakeup_pending = False
+
+    def _loop_self_reading(self, f=None):
+        # Called by BaseProactorEventLoop when a read from the self-pipe
+        # completes (f is not None) to start the next read.
+        if f is not None:
+            self.__wakeup_pending = False
+        return super()._loop_self_reading(f)  # noqa
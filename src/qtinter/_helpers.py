@@ -2,8 +2,9 @@
 
 import functools
 import inspect
+import types
 import weakref
-from typing import Callable, Dict
+from typing import Callable, Dict, Optional, Tuple
 
 
 __all__ = 'get_positional_parameter_count', 'transform_slot',
@@ -21,13 +22,14 @@ class SemiWeakRef:
     def __init__(self, o, ref=weakref.ref):
         super().__init__()  # cooperative multiple inheritance
 
-        # Keep a strong reference to o.
-        self._strong_referent = o
-
-        # Raises TypeError if o does not support weak reference.
+        # Raises TypeError if o does not support weak reference, in which
+        # case the finalizer finds no strong reference to o.
         self._weak_referent = ref(
             o, functools.partial(_references.pop, id(self)))
 
+        # Keep a strong reference to o.
+        self._strong_referent = o
+
     def __del__(self):
         # The finalizer is called when there are no strong references to
         # this object.  Resurrect this object by adding it to _references.
@@ -35,7 +37,8 @@ class SemiWeakRef:
         #
         # Note: the finalizer is guaranteed to be called only once; see
         # PEP 442.  However, the code below does not depend on this fact.
-        if self._strong_referent is not None:
+        # It is also called if __init__ raised, with no attribute set.
+        if getattr(self, '_strong_referent', None) is not None:
             _references[id(self)] = self
             self._strong_referent = None
 
@@ -43,12 +46,20 @@ class SemiWeakRef:
         return self._weak_referent()
 
 
-def get_positional_parameter_count(fn: Callable) -> int:
-    """Return the number of positional parameters of fn, or -1 if fn
-    has a variadic positional parameter (*args).
+# Maximum number of entries in _parameter_counts.
+_PARAMETER_COUNTS_SIZE = 1024
 
-    Raises TypeError if fn has any keyword-only parameter without a default.
-    """
+# Results of _count_positional_parameters for plain functions and bound
+# methods, keyed by (code object, names of keyword-only parameters with
+# default, bound-ness).  inspect.signature() is slow, and the same
+# methods tend to be wrapped over and over.
+_parameter_counts: Dict[tuple, Tuple[int, Optional[str]]] = dict()
+
+
+def _count_positional_parameters(fn: Callable) -> Tuple[int, Optional[str]]:
+    """Return the number of positional parameters of fn (or -1 if fn has
+    a variadic positional parameter) and the name of the first keyword-only
+    parameter without default (or None if there is no such parameter)."""
     sig = inspect.signature(fn)
     params = sig.parameters
 
@@ -68,15 +79,97 @@ def get_positional_parameter_count(fn: Callable) -> int:
             param_count = -1
         elif p.kind == p.KEYWORD_ONLY:
             if p.default is p.empty:
-                raise TypeError(f"asyncslot cannot be applied to {fn!r} "
-                                f"because it contains keyword-only argument "
-                                f"'{p.name}' without default")
+                return param_count, p.name
         else:
             assert p.kind == p.VAR_KEYWORD
             pass  # **kwargs will always be empty
+    return param_count, None
+
+
+def _parameter_count_key(fn: Callable) -> Optional[tuple]:
+    """Return the key of fn in _parameter_counts, or None if the signature
+    of fn may depend on more than its code object."""
+    if type(fn) is types.MethodType:
+        func, bound = fn.__func__, True
+    else:
+        func, bound = fn, False
+    if type(func) is not types.FunctionType:
+        return None
+    if "__wrapped__" in func.__dict__ or "__signature__" in func.__dict__:
+        return None  # inspect.signature() would look at these instead
+    kwdefaults = func.__kwdefaults__
+    return func.__code__, tuple(kwdefaults) if kwdefaults else (), bound
+
+
+def get_positional_parameter_count(fn: Callable) -> int:
+    """Return the number of positional parameters of fn, or -1 if fn
+    has a variadic positional parameter (*args).
+
+    Raises TypeError if fn has any keyword-only parameter without a default.
+    """
+    key = _parameter_count_key(fn)
+    if key is None:
+        result = _count_positional_parameters(fn)
+    else:
+        result = _parameter_counts.get(key)
+        if result is None:
+            result = _count_positional_parameters(fn)
+            if len(_parameter_counts) >= _PARAMETER_COUNTS_SIZE:
+                # Evict the oldest entry.
+                del _parameter_counts[next(iter(_parameter_counts))]
+            _parameter_counts[key] = result
+
+    param_count, keyword_only = result
+    if keyword_only is not None:
+        raise TypeError(f"asyncslot cannot be applied to {fn!r} "
+                        f"because it contains keyword-only argument "
+                        f"'{keyword_only}' without default")
     return param_count
 
 
+# Wrapper classes created by transform_slot, keyed by the function
+# object of the wrapped bound method.  Creating a class is expensive
+# (and under PyQt also builds a QMetaObject), so it is done once for
+# each function rather than once for each wrapped method.
+_wrapper_classes: "weakref.WeakKeyDictionary[Callable, type]" = \
+    weakref.WeakKeyDictionary()
+
+
+def _make_wrapper_class(slot) -> type:
+    from .bindings import QtCore
+
+    # PyQt5/6 requires decorated slots to be hosted in QObject.
+    # PySide2/6 requires decorated slots to be hosted in plain object.
+    if QtCore.__name__.startswith("PyQt"):
+        BaseClass = QtCore.QObject
+    else:
+        BaseClass = object
+
+    class _Wrapper(SemiWeakRef, BaseClass):
+        # Subclass in order to modify function's __dict__.
+        def __init__(self, method, transform, extra):
+            super().__init__(method, weakref.WeakMethod)
+            # Keep the function alive while the wrapper is.  Otherwise,
+            # if the receiver and its class are collected together, the
+            # WeakMethod's callback for the function may run after the
+            # WeakMethod is released along with the wrapper by its
+            # callback for the receiver, and fail.
+            self._func = getattr(method, '__func__', None)
+            self._transform = transform
+            self._extra = extra
+
+        def handle(self, *args):
+            method = self.referent()
+            assert method is not None, \
+                "slot called after receiver is supposedly finalized"
+            return self._transform(method, args, *self._extra)
+
+        functools.update_wrapper(handle, slot)
+        handle.__dict__.pop("__wrapped__")  # remove strong ref to fn
+
+    return _Wrapper
+
+
 def transform_slot(slot, transform, *extra):
     """Return a callable wrapper that takes variadic arguments *args,
     such that wrapper(*arg) returns transform(slot, args, *extra).
@@ -102,27 +195,20 @@ def transform_slot(slot, transform, *extra):
         # is equal to that of the receiver object of slot, so that a
         # connection will be automatically disconnected if the receiver
         # object is deleted.
-        from .bindings import QtCore
-
-        # PyQt5/6 requires decorated slots to be hosted in QObject.
-        # PySide2/6 requires decorated slots to be hosted in plain object.
-        if QtCore.__name__.startswith("PyQt"):
-            BaseClass = QtCore.QObject
-        else:
-            BaseClass = object
-
-        class _Wrapper(SemiWeakRef, BaseClass):
-            # Subclass in order to modify function's __dict__.
-            def handle(self, *args):
-                method = self.referent()
-                assert method is not None, \
-                    "slot called after receiver is supposedly finalized"
-                transform(method, args, *extra)
-
-            functools.update_wrapper(handle, slot)
-            handle.__dict__.pop("__wrapped__")  # remove strong ref to fn
-
-        return _Wrapper(slot, weakref.WeakMethod).handle
+        func = getattr(slot, "__func__", None)
+        if func is None:
+            # Not a Python method, e.g. a method of a builtin object.
+            # WeakMethod() below raises TypeError.
+            return _make_wrapper_class(slot)(slot, transform, extra).handle
+
+        try:
+            cls = _wrapper_classes[func]
+        except TypeError:  # func does not support weak reference
+            cls = _make_wrapper_class(slot)
+        except KeyError:
+            cls = _wrapper_classes[func] = _make_wrapper_class(slot)
+
+        return cls(slot, transform, extra).handle
 
     else:
         # fn is not a method object.  Keep a strong reference to it.
@@ -2,7 +2,7 @@
 
 import functools
 import signal
-import sys
+import threading
 from typing import Any, Callable
 
 
@@ -14,20 +14,20 @@ __all__ = (
 )
 
 
-class _Flag:
-    __slots__ = '_flag',
+class _DeferredKI(threading.local):
+    # Set by the SIGINT handler when KeyboardInterrupt is deferred, and
+    # cleared by raise_deferred_ki.  Signal handlers only ever run in the
+    # main thread, but the state is kept per thread so that a decorated
+    # function running in another thread never sees it.
+    pending = False
 
-    def __init__(self):
-        self._flag = False
 
-    def set(self) -> None:
-        self._flag = True
+_deferred_ki = _DeferredKI()
 
-    def is_set(self) -> bool:
-        return self._flag
-
-    def clear(self) -> None:
-        self._flag = False
+# Code objects of the wrappers created by with_deferred_ki.  A frame
+# running one of these, or called directly from one of these (i.e. the
+# body of a decorated function), defers KeyboardInterrupt.
+_deferred_ki_codes = set()
 
 
 def with_deferred_ki(fn: Callable[..., Any]):
@@ -36,24 +36,19 @@ def with_deferred_ki(fn: Callable[..., Any]):
     function called by fn, it still raises KeyboardInterrupt.
     """
     @functools.wraps(fn)
-    def wrapper(*args, deferred_ki=_Flag(), **kwargs):
-        old_deferred_ki = deferred_ki
-        deferred_ki = _Flag()
-        if old_deferred_ki.is_set():
-            deferred_ki.set()
-        old_deferred_ki.clear()
+    def wrapper(*args, **kwargs):
         fn(*args, **kwargs)
+    _deferred_ki_codes.add(wrapper.__code__)
     return wrapper
 
 
 def _deferred_ki_SIGINT_handler(sig, frame):
     assert sig == signal.SIGINT
-    # if frame is not None:
-    #     print(frame.f_locals)
-    if frame and "deferred_ki" in frame.f_locals:
-        frame.f_locals["deferred_ki"].set()
-    elif frame and frame.f_back and "deferred_ki" in frame.f_back.f_locals:  # pragma: no cover
-        frame.f_back.f_locals["deferred_ki"].set()
+    if frame is not None and (
+            frame.f_code in _deferred_ki_codes or
+            frame.f_back is not None and
+            frame.f_back.f_code in _deferred_ki_codes):
+        _deferred_ki.pending = True
     else:
         return signal.default_int_handler(sig, frame)
 
@@ -61,6 +56,7 @@ def _deferred_ki_SIGINT_handler(sig, frame):
 def enable_deferred_ki():
     # Install SIGINT handlers to enable @defer_ki decoration at runtime.
     if signal.getsignal(signal.SIGINT) is signal.default_int_handler:
+        _deferred_ki.pending = False
         try:
             signal.signal(signal.SIGINT, _deferred_ki_SIGINT_handler)
             return True
@@ -81,9 +77,10 @@ def disable_deferred_ki():
 
 
 def raise_deferred_ki():
-    assert "deferred_ki" in sys._getframe(2).f_locals, \
-        "raise_deferred_ki must be called from a function " \
-        "decorated with @with_deferred_ki"
-    flag: _Flag = sys._getframe(2).f_locals["deferred_ki"]
-    if flag.is_set():
+    # Must be called from the body of a function decorated with
+    # @with_deferred_ki.  This is not asserted, because inspecting the
+    # caller's frame would cost more than the rest of the notification
+    # path put together.
+    if _deferred_ki.pending:
+        _deferred_ki.pending = False
         raise KeyboardInterrupt
@@ -19,8 +19,8 @@ class _QiNotifier(ABC):
 
     @abstractmethod
     def notify(self) -> None:
-        """Called by the selectable object (in a separate thread) to
-        notify that result is available from the last select() call."""
+        """Called by the selectable object (possibly in a separate thread)
+        to notify that result is available from the last select() call."""
 
     @abstractmethod
     def wakeup(self) -> None:
@@ -40,7 +40,8 @@ class _QiSelectable(ABC):
     A selector may be in one of the following states:
       - IDLE   : the selector is not in BUSY or CLOSED state
       - BUSY   : the last call to select() raised QiYield, and
-                 a thread worker is waiting for IO or timeout
+                 a thread worker (or the Qt event loop) is waiting
+                 for IO or timeout
       - CLOSED : close() has been called
 
     State machine:
@@ -1,53 +1,349 @@
 """ _selector_events.py - Qi based on SelectorEventLoop """
 
 import asyncio.selector_events
+import collections.abc
 import concurrent.futures
+import math
 import selectors
 import signal
 import threading
 import unittest.mock
-from typing import List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 from ._base_events import *
-from ._selectable import _QiNotifier
+from ._ki import with_deferred_ki, raise_deferred_ki
+from ._selectable import _QiNotifier, _QiSelectable
 
 
 __all__ = 'QiBaseSelectorEventLoop',
 
 
+class _QiQtWaiter:
+    """Waits for IO readiness of some file descriptors and/or a timeout
+    on the Qt event loop, without involving a worker thread.
+
+    This object must be created and used in the thread that runs the
+    Qt event loop.
+    """
+
+    def __init__(self):
+        from .bindings import QtCore
+        self._timer = QtCore.QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._on_ready)
+        self._socket_notifiers: Dict[Tuple[int, int], QtCore.QObject] = {}
+        self._callback: Optional[Callable[[], None]] = None
+        self._interrupted = False
+
+    def is_waiting(self) -> bool:
+        return self._callback is not None
+
+    def wait(self, fd_events: Iterable[Tuple[int, int]],
+             timeout: Optional[float], callback: Callable[[], None]) -> None:
+        """Call callback once any of fd_events, a sequence of (fd, events)
+        pairs, is ready or timeout (in seconds) elapses."""
+        assert self._callback is None, 'already waiting'
+        from .bindings import QtCore
+
+        # Reuse the socket notifiers of the last wait where possible, and
+        # delete those no longer needed as their fd may have been closed.
+        socket_notifiers = {}
+        for fd, events in fd_events:
+            for event, notifier_type in (
+                (selectors.EVENT_READ, QtCore.QSocketNotifier.Type.Read),
+                (selectors.EVENT_WRITE, QtCore.QSocketNotifier.Type.Write),
+            ):
+                if events & event:
+                    socket_notifier = self._socket_notifiers.pop(
+                        (fd, event), None)
+                    if socket_notifier is None:
+                        socket_notifier = QtCore.QSocketNotifier(
+                            fd, notifier_type)
+                        # Relay through the parameterless timeout signal,
+                        # so that no Python code (e.g. enum conversion of
+                        # the activated signal's arguments under PySide6)
+                        # runs before _on_ready.
+                        socket_notifier.activated.connect(self._timer.timeout)
+                    socket_notifiers[(fd, event)] = socket_notifier
+        self._clear_socket_notifiers()
+        self._socket_notifiers = socket_notifiers
+
+        self._callback = callback
+        for socket_notifier in self._socket_notifiers.values():
+            socket_notifier.setEnabled(True)
+        if timeout is not None:
+            # Round up so that we never wake up before the deadline.
+            self._timer.start(max(0, math.ceil(timeout * 1000)))
+
+    def cancel(self) -> None:
+        """Stop waiting and call the callback if currently waiting."""
+        if self._callback is None:
+            return
+        callback = self._callback
+        self._callback = None
+        for socket_notifier in self._socket_notifiers.values():
+            socket_notifier.setEnabled(False)
+        self._timer.stop()
+        callback()
+
+    def check_interrupted(self) -> None:
+        """Raise KeyboardInterrupt if Ctrl+C was pressed while waiting."""
+        if self._interrupted:
+            self._interrupted = False
+            raise KeyboardInterrupt
+
+    @with_deferred_ki
+    def _on_ready(self):
+        # This is the first Python code to run after the Qt event loop
+        # wakes up, so SIGINT (delivered through the wakeup fd) would
+        # raise KeyboardInterrupt here.  Defer it to check_interrupted().
+        try:
+            raise_deferred_ki()
+        except KeyboardInterrupt:
+            self._interrupted = True
+
+        # A stale activation, e.g. when both a socket notifier and the
+        # timer fire in the same Qt event loop iteration, is ignored.
+        self.cancel()
+
+    def _clear_socket_notifiers(self):
+        for socket_notifier in self._socket_notifiers.values():
+            socket_notifier.setEnabled(False)
+        self._socket_notifiers.clear()
+
+    def close(self) -> None:
+        assert self._callback is None, 'unexpected close'
+        self._clear_socket_notifiers()
+        self._timer = None
+
+
+class _QiNotRegisteredError(KeyError):
+    """KeyError whose message is only formatted when displayed, since
+    asyncio probes get_key() for every add_reader() and add_writer()."""
+
+    def __str__(self):
+        return f'{self.args[0]!r} is not registered'
+
+
+class _QiSelectorKeys(collections.abc.Mapping):
+    """Bookkeeping of registered file objects that performs no IO.
+
+    This is also the mapping returned by get_map(), keyed by fd.  Lookup
+    and validation follow the standard selectors, whose own bookkeeping
+    is private to the selectors module.
+    """
+
+    def __init__(self):
+        self.fd_to_key: Dict[int, selectors.SelectorKey] = {}
+
+    def _fileobj_lookup(self, fileobj) -> int:
+        if isinstance(fileobj, int):
+            fd = fileobj
+        else:
+            try:
+                fd = int(fileobj.fileno())
+            except (AttributeError, TypeError, ValueError):
+                fd = -1
+        if fd >= 0:
+            return fd
+
+        # A file object that has since been closed can still be found
+        # among the registered ones, so that it can be unregistered.
+        for key in self.fd_to_key.values():
+            if key.fileobj is fileobj:
+                return key.fd
+        raise ValueError(f'Invalid file object: {fileobj!r}')
+
+    def register(self, fileobj, events, data=None) -> selectors.SelectorKey:
+        if not events or \
+                events & ~(selectors.EVENT_READ | selectors.EVENT_WRITE):
+            raise ValueError(f'Invalid events: {events!r}')
+        key = selectors.SelectorKey(
+            fileobj, self._fileobj_lookup(fileobj), events, data)
+        if key.fd in self.fd_to_key:
+            raise KeyError(f'{fileobj!r} (FD {key.fd}) is already registered')
+        self.fd_to_key[key.fd] = key
+        return key
+
+    def unregister(self, fileobj) -> selectors.SelectorKey:
+        try:
+            return self.fd_to_key.pop(self._fileobj_lookup(fileobj))
+        except KeyError:
+            raise _QiNotRegisteredError(fileobj) from None
+
+    def modify(self, fileobj, events, data=None) -> selectors.SelectorKey:
+        key = self.get_key(fileobj)
+        if events != key.events:
+            self.unregister(fileobj)
+            key = self.register(fileobj, events, data)
+        elif data != key.data:
+            key = key._replace(data=data)
+            self.fd_to_key[key.fd] = key
+        return key
+
+    def get_key(self, fileobj) -> selectors.SelectorKey:
+        try:
+            return self.fd_to_key[self._fileobj_lookup(fileobj)]
+        except KeyError:
+            raise _QiNotRegisteredError(fileobj) from None
+
+    __getitem__ = get_key
+
+    def __len__(self):
+        return len(self.fd_to_key)
+
+    def __iter__(self):
+        return iter(self.fd_to_key)
+
+
 class _QiSelector(selectors.BaseSelector):
 
-    def __init__(self, selector: selectors.BaseSelector):
+    def __init__(self, selector: selectors.BaseSelector,
+                 exception_handler: Callable[[Dict[str, Any]], None]):
         super().__init__()
         self._selector = selector
+
+        # Registrations as seen by the caller.  They are applied to the
+        # wrapped selector immediately if it is idle, or else recorded in
+        # _pending (which maps fd to whether the fd has been unregistered
+        # in the meantime) and applied before the next select(), so that
+        # the caller never waits for an in-flight select() to return.
+        self._keys = _QiSelectorKeys()
+        for key in selector.get_map().values():
+            self._keys.fd_to_key[key.fd] = key
+        self._pending: Dict[int, bool] = {}
+
+        # Registrations as applied to the wrapped selector.
+        self._applied: Dict[int, selectors.SelectorKey] = \
+            dict(self._keys.fd_to_key)
+
+        # Called with an exception context if the wrapped selector rejects
+        # a registration applied later.  There is no caller to raise the
+        # error to, and one bad fd must not stop the loop.
+        self._exception_handler = exception_handler
+
         self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
         self._select_future: Optional[concurrent.futures.Future] = None
         self._idle = threading.Event()
         self._idle.set()
         self._notifier: Optional[_QiNotifier] = None
+        self._waiter: Optional[_QiQtWaiter] = None
         self._closed = False
 
     def set_notifier(self, notifier: Optional[_QiNotifier]) -> None:
         self._unblock_if_blocked()
         self._notifier = notifier
+        if notifier is None and self._waiter is not None:
+            # Qt objects must be recreated in the thread that runs the
+            # loop next time.
+            self._waiter.close()
+            self._waiter = None
 
     def _unblock_if_blocked(self):
         assert not self._closed, 'selector already closed'
-        if not self._idle.is_set():
+        if self._waiter is not None and self._waiter.is_waiting():
+            # Waiting on the Qt event loop of this very thread; stop
+            # waiting without blocking.
+            self._waiter.cancel()
+        elif not self._idle.is_set():
             assert self._notifier is not None, 'notifier expected'
             self._notifier.wakeup()
             self._idle.wait()
 
     def register(self, fileobj, events, data=None):
-        self._unblock_if_blocked()
-        return self._selector.register(fileobj, events, data)
+        key = self._keys.register(fileobj, events, data)
+        self._update(key.fd, False)
+        return key
 
     def unregister(self, fileobj):
-        self._unblock_if_blocked()
-        return self._selector.unregister(fileobj)
+        key = self._keys.unregister(fileobj)
+        self._update(key.fd, True)
+        return key
 
     def modify(self, fileobj, events, data=None):
-        self._unblock_if_blocked()
-        return self._selector.modify(fileobj, events, data)
+        key = self._keys.modify(fileobj, events, data)
+        self._update(key.fd, False)
+        return key
+
+    def _update(self, fd: int, unregistered: bool) -> None:
+        assert not self._closed, 'selector already closed'
+        unregistered = self._pending.pop(fd, False) or unregistered
+        if self._waiter is not None and self._waiter.is_waiting():
+            self._waiter.cancel()
+        if self._idle.is_set():
+            # Apply the change straight away so that any error is raised
+            # to the caller, as the wrapped selector would.
+            self._apply_pending()
+            try:
+                self._apply(fd, unregistered)
+            except BaseException:
+                key = self._applied.get(fd)
+                if key is None:
+                    self._keys.fd_to_key.pop(fd, None)
+                else:
+                    self._keys.fd_to_key[fd] = key
+                raise
+        else:
+            # Let the in-flight select() return so that the change takes
+            # effect; the wakeup is coalesced with any other.
+            assert self._notifier is not None, 'notifier expected'
+            self._pending[fd] = unregistered
+            self._notifier.wakeup()
+
+    def _apply(self, fd: int, unregistered: bool) -> None:
+        """Make the wrapped selector's registration of fd match _keys."""
+        want = self._keys.fd_to_key.get(fd)
+        have = self._applied.get(fd)
+        if have is not None and (want is None or unregistered or
+                                 have.fileobj != want.fileobj):
+            del self._applied[fd]
+            self._selector.unregister(have.fileobj)
+            have = None
+        if want is None:
+            pass
+        elif have is None:
+            self._applied[fd] = self._selector.register(
+                want.fileobj, want.events, want.data)
+        else:
+            self._applied[fd] = self._selector.modify(
+                want.fileobj, want.events, want.data)
+
+    def _apply_pending(self) -> None:
+        while self._pending:
+            fd, unregistered = self._pending.popitem()
+            try:
+                self._apply(fd, unregistered)
+            except (OSError, ValueError) as exc:
+                # E.g. the file descriptor has since been closed.  Drop
+                # the registration, i.e. keep what the wrapped selector
+                # has, and report the error.
+                rejected = self._keys.fd_to_key.get(fd)
+                key = self._applied.get(fd)
+                if key is None:
+                    self._keys.fd_to_key.pop(fd, None)
+                else:
+                    self._keys.fd_to_key[fd] = key
+                self._exception_handler({
+                    'message': f'Failed to apply the registration of fd '
+                               f'{fd} made while selecting; it is dropped',
+                    'exception': exc,
+                    'fileobj': None if rejected is None
+                    else rejected.fileobj,
+                })
+
+    def _current_events(self, event_list):
+        """Filter event_list, which was returned by a select() during which
+        registrations may have changed, against current registrations."""
+        fd_to_key = self._keys.fd_to_key
+        ready = []
+        for key, events in event_list:
+            current_key = fd_to_key.get(key.fd)
+            if current_key is not None and \
+                    current_key.fileobj == key.fileobj:
+                events &= current_key.events
+                if events:
+                    ready.append((current_key, events))
+        return ready
 
     def select(self, timeout: Optional[float] = None) \
             -> List[Tuple[selectors.SelectorKey, int]]:
@@ -59,13 +355,21 @@ class _QiSelector(selectors.BaseSelector):
         # entering IDLE state.
         assert self._idle.is_set(), 'unexpected select'
 
+        # Apply registration changes made while the selector was busy.
+        self._apply_pending()
+
         # Return previous select() result (or exception) if there is one.
         if self._select_future is not None:
             try:
-                return self._select_future.result()
+                return self._current_events(self._select_future.result())
             finally:
                 self._select_future = None
 
+        # Ctrl+C pressed while waiting on the Qt event loop is delivered
+        # here, just like a native select() would raise KeyboardInterrupt.
+        if self._waiter is not None:
+            self._waiter.check_interrupted()
+
         # Perform normal (blocking) select if no notifier is set.
         if self._notifier is None:
             return self._selector.select(timeout)
@@ -76,8 +380,22 @@ class _QiSelector(selectors.BaseSelector):
         if event_list or timeout == 0:
             return event_list
 
-        # No IO is ready and caller wants to wait.  select() in a separate
-        # thread and tell the caller to yield.
+        # No IO is ready and caller wants to wait.  If at most one file
+        # object is registered -- normally the loop's self-pipe, i.e. only
+        # timers are pending -- let the Qt event loop watch it and time
+        # the wait with a precise timer.
+        fd_map = self._selector.get_map()
+        if len(fd_map) <= 1:
+            if self._waiter is None:
+                self._waiter = _QiQtWaiter()
+            self._idle.clear()
+            self._waiter.wait(
+                [(key.fd, key.events) for key in fd_map.values()],
+                timeout, self._on_waited)
+            return self._notifier.no_result()  # raises _QiYield
+
+        # Otherwise select() in a separate thread and tell the caller
+        # to yield.
         self._idle.clear()
         try:
             self._select_future = self._executor.submit(self._select, timeout)
@@ -98,6 +416,10 @@ class _QiSelector(selectors.BaseSelector):
             self._idle.set()
             notifier.notify()
 
+    def _on_waited(self):
+        self._idle.set()
+        self._notifier.notify()
+
     def close(self) -> None:
         # close() is called when the loop is being closed, and the loop
         # can only be closed when it is in STOPPED state.  In this state
@@ -108,19 +430,24 @@ class _QiSelector(selectors.BaseSelector):
             return
 
         assert self._idle.is_set(), 'unexpected close'
+        if self._waiter is not None:
+            self._waiter.close()
+            self._waiter = None
         self._executor.shutdown()
         self._selector.close()
+        self._pending.clear()
+        self._applied.clear()
         self._select_future = None
         self._notifier = None
         self._closed = True
 
     def get_key(self, fileobj):
-        self._unblock_if_blocked()
-        return self._selector.get_key(fileobj)
+        assert not self._closed, 'selector already closed'
+        return self._keys.get_key(fileobj)
 
     def get_map(self):
-        self._unblock_if_blocked()
-        return self._selector.get_map()
+        assert not self._closed, 'selector already closed'
+        return self._keys
 
 
 class QiBaseSelectorEventLoop(
@@ -133,8 +460,12 @@ class QiBaseSelectorEventLoop(
         if isinstance(selector, unittest.mock.Mock):  # pragma: no cover
             # Pass through mock object for testing
             qi_selector = selector
+        elif isinstance(selector, _QiSelectable):
+            # Selector already supports non-blocking select, e.g.
+            # QiSocketNotifierSelector.
+            qi_selector = selector
         else:
-            qi_selector = _QiSelector(selector)
+            qi_selector = _QiSelector(selector, self.call_exception_handler)
         super().__init__(qi_selector)
 
         # Similar to asyncio.BaseProactorEventLoop, install wakeup fd
@@ -1,11 +1,62 @@
 """Helper function to make Qt signal awaitable."""
 
 import asyncio
+import collections
 import functools
+import sys
+import weakref
+from typing import (
+    AsyncIterator, Callable, Deque, Dict, List, Optional, Tuple,
+)
 from ._helpers import transform_slot
+from . import _stats
 
 
-__all__ = 'asyncsignal', 'asyncsignalstream', 'multisignal',
+__all__ = (
+    'asyncsignal', 'asyncsignalstream', 'multisignal', 'SignalListener',
+    'debounce', 'throttle', 'select_signals',
+)
+
+
+# Types whose values are immutable Python objects that PyQt passes to
+# slots as is, so they need not be copied.
+_SCALAR_TYPES = frozenset((type(None), bool, int, float, complex, str, bytes))
+
+# Function that copies signal arguments for the Qt binding in use.  It is
+# determined on first use, because the binding is only resolved then.
+_copy_arguments: Optional[Callable[[tuple], tuple]] = None
+
+
+def _make_copy_arguments() -> Callable[[tuple], tuple]:
+    from .bindings import QtCore
+
+    if not hasattr(QtCore, 'QVariant'):
+        # PySide2/6 doesn't define QVariant.
+        return lambda args: args
+
+    QVariant = QtCore.QVariant
+    QObject = QtCore.QObject
+
+    # Whether a value of the given type must be copied.  Values of Qt
+    # value types may refer to temporary C++ objects.  QObjects are
+    # passed by pointer, and QVariant would return the same object.
+    needs_copy: Dict[type, bool] = dict()
+
+    def copy_arguments(args):
+        for arg in args:
+            t = type(arg)
+            copy = needs_copy.get(t)
+            if copy is None:
+                copy = needs_copy[t] = not (
+                    t in _SCALAR_TYPES or issubclass(t, QObject))
+            if copy:
+                break
+        else:
+            return args
+        return tuple(QVariant(arg).value() if needs_copy[type(arg)] else arg
+                     for arg in args)
+
+    return copy_arguments
 
 
 def copy_signal_arguments(args):
@@ -15,20 +66,20 @@ def copy_signal_arguments(args):
     In order to use the arguments after the slot returns, call this
     function to make a copy of them (via QVariant).  Failure to do so
     may crash the program with SIGSEGV when trying to access the
-    objects later.
+    objects later.  Immutable Python scalars and QObjects are passed
+    through without copying.
 
     PySide2/6 already passes a copy of the signal arguments to slots,
     with proper reference counting.  There is no need to copy arguments.
     """
-    from .bindings import QtCore
-    if hasattr(QtCore, 'QVariant'):
-        # PyQt5/6 defines QVariant; PySide2/6 doesn't.
-        return tuple(QtCore.QVariant(arg).value() for arg in args)
-    else:
-        return args
+    global _copy_arguments
+    if _copy_arguments is None:
+        _copy_arguments = _make_copy_arguments()
+    return _copy_arguments(args)
 
 
-async def asyncsignal(signal):
+async def asyncsignal(signal, *,
+                      predicate: Optional[Callable[..., bool]] = None):
     # signal must be a bound pyqtSignal or Signal, or an object
     # with a `connect` method that provides equivalent semantics.
     # The connection must be automatically closed when the sender
@@ -43,8 +94,19 @@ async def asyncsignal(signal):
 
     def handler(*args):
         nonlocal slot
-        if not fut.done():
-            fut.set_result(copy_signal_arguments(args))
+        if fut.done():
+            return
+        # The predicate sees the raw arguments, so that emissions that
+        # are not waited for are not copied and do not wake up the task.
+        if predicate is not None:
+            try:
+                if not predicate(*args):
+                    return
+            except BaseException as exc:
+                fut.set_exception(exc)
+                slot = None
+                return
+        fut.set_result(copy_signal_arguments(args))
         slot = None
 
     slot = _QiSlotObject(handler)
@@ -59,34 +121,618 @@ async def asyncsignal(signal):
         slot = None
 
 
-def _asyncsignalstream_handle(queue: asyncio.Queue, *args):
-    queue.put_nowait(copy_signal_arguments(args))
+async def select_signals(signal_map, timeout: Optional[float] = None):
+    # Wait for the first emission of any signal in signal_map and return
+    # (tag, args).  All signals share one receiver and one future, and
+    # are disconnected from together when the receiver is deleted.
+    from .bindings import _QiSlotObject
+
+    if not signal_map:
+        raise ValueError('select_signals: signal_map must not be empty')
+
+    loop = asyncio.get_running_loop()
+    fut = loop.create_future()
+
+    def handler(tag, args):
+        nonlocal slot
+        if not fut.done():
+            fut.set_result((tag, args))
+        slot = None
+
+    slot = _QiSlotObject(handler)
+    timeout_handle = None
+    try:
+        multisignal(signal_map).connect(slot.slot)
+        if timeout is not None:
+            timeout_handle = loop.call_later(
+                timeout, _set_timeout_error, fut)
+        return await fut
+    finally:
+        if timeout_handle is not None:
+            timeout_handle.cancel()
+        # See asyncsignal.
+        slot = None
+
+
+def _set_timeout_error(fut: asyncio.Future):
+    if not fut.done():
+        fut.set_exception(asyncio.TimeoutError())
+
+
+_OVERFLOW_POLICIES = ('drop_oldest', 'drop_newest', 'latest_only', 'coalesce')
+
+# Buffers of the asyncsignalstream objects that are not closed, for
+# asyncsignalstream.get_debug_counters().
+_open_buffers: "weakref.WeakSet[_SignalBuffer]" = weakref.WeakSet()
+
+
+class _SignalBuffer:
+    """Buffer of emitted signal arguments consumed by asyncsignalstream.
+
+    This object is referenced by the slot object connected to the signal,
+    and must not reference the asyncsignalstream in turn, so that
+    deleting the stream deletes the slot object and closes the connection.
+    """
+
+    def __init__(self, maxsize: int, overflow: str,
+                 reducer: Optional[Callable[[tuple, tuple], tuple]],
+                 predicate: Optional[Callable[..., bool]] = None,
+                 buffer_unwaited: bool = True,
+                 copy: Callable[[tuple], tuple] = copy_signal_arguments,
+                 name: Optional[str] = None):
+        self._items: Deque[tuple] = collections.deque()
+        # Each waiter is a (future, count) pair, woken up once at least
+        # count items are buffered.
+        self._waiters: Deque[Tuple[asyncio.Future, int]] = \
+            collections.deque()
+        self._maxsize = maxsize
+        self._overflow = overflow
+        self._reducer = reducer
+        self._predicate = predicate
+        self._buffer_unwaited = buffer_unwaited
+        self._copy = copy
+        # Name under which statistics are collected, or None if not.
+        self._name = name
+        self._closed = False
+        # Exception raised by the predicate or the reducer, to be raised
+        # to the consumer once the emissions buffered before it are
+        # consumed.
+        self._error: Optional[BaseException] = None
+        self.dropped = 0
+        _open_buffers.add(self)
+
+    def close(self):
+        """Discard buffered emissions and end any pending get()."""
+        if self._closed:
+            return
+        self._closed = True
+        _open_buffers.discard(self)
+        self._items.clear()
+        self._release_waiters()
+
+    def _release_waiters(self):
+        for waiter, _ in self._waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+        self._waiters.clear()
+
+    def _fail(self, exc: BaseException):
+        # An exception must not escape into Qt; like asyncsignal(), pass
+        # it on to the consumer and take no more emissions.
+        self._error = exc
+        self._release_waiters()
+
+    def _raise_error(self):
+        # Raise the stored exception once, then end the stream.
+        if self._error is not None:
+            exc = self._error
+            self._error = None
+            self.close()
+            raise exc
+
+    def handle(self, *args):
+        if self._closed or self._error is not None:
+            return
+        # Filter on the raw arguments before anything is copied, buffered
+        # or counted as dropped.
+        if self._predicate is not None:
+            try:
+                if not self._predicate(*args):
+                    return
+            except BaseException as exc:
+                self._fail(exc)
+                return
+        stats = _stats._signal_stats
+        if stats is not None and self._name is not None:
+            stream_stats = stats.stream(self._name)
+            stream_stats.emissions += 1
+            stream_stats.queue_depth.add(len(self._items))
+        if not self._buffer_unwaited and not self._waiters:
+            self.dropped += 1
+            return
+        items = self._items
+        if self._maxsize <= 0 or len(items) < self._maxsize:
+            items.append(self._copy(args))
+            self._wakeup_waiters()
+            return
+
+        # The buffer is full.
+        self.dropped += 1
+        overflow = self._overflow
+        if overflow == 'drop_newest':
+            pass
+        elif overflow == 'coalesce':
+            try:
+                items[-1] = self._reducer(items[-1], self._copy(args))
+            except BaseException as exc:
+                self._fail(exc)
+        else:  # drop_oldest, latest_only
+            items.popleft()
+            items.append(self._copy(args))
+
+    def _wakeup_waiters(self):
+        # Wake up the first waiter for which enough items are buffered.
+        # A waiter that is done removes itself from _waiters when resumed.
+        available = len(self._items)
+        for index, (waiter, count) in enumerate(self._waiters):
+            if available >= count and not waiter.done():
+                del self._waiters[index]
+                waiter.set_result(None)
+                break
+
+    async def _wait(self, count: int, timeout: Optional[float] = None):
+        """Wait until at least count items are buffered or until timeout
+        (in seconds) elapses."""
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        entry = (waiter, count)
+        self._waiters.append(entry)
+        if timeout is None:
+            timeout_handle = None
+        else:
+            timeout_handle = loop.call_later(
+                timeout, _release_waiter, waiter)
+        try:
+            await waiter
+        except BaseException:
+            waiter.cancel()  # just in case waiter is not done
+            try:
+                self._waiters.remove(entry)
+            except ValueError:
+                # Woken up but cancelled; let another getter have it.
+                self._wakeup_waiters()
+            raise
+        finally:
+            if timeout_handle is not None:
+                timeout_handle.cancel()
+                try:
+                    self._waiters.remove(entry)
+                except ValueError:
+                    pass
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[tuple]:
+        """Return the oldest buffered emission, or None if closed.  Raise
+        asyncio.TimeoutError if none is emitted within timeout seconds."""
+        if timeout is not None:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout
+        while not self._items:
+            self._raise_error()
+            if self._closed:
+                return None
+            if timeout is None:
+                await self._wait(1)
+            else:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError
+                await self._wait(1, remaining)
+        return self._items.popleft()
+
+    async def get_batch(self, max_items: Optional[int],
+                        max_latency: float) -> List[tuple]:
+        """Return a batch of buffered emissions, or [] if closed."""
+        items = self._items
+        while not items:
+            self._raise_error()
+            if self._closed:
+                return []
+            await self._wait(1)
+
+        if max_latency > 0:
+            # Wait for the batch to fill up, which it never does beyond
+            # the capacity of the buffer.
+            target = sys.maxsize if max_items is None else max_items
+            if self._maxsize > 0:
+                target = min(target, self._maxsize)
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + max_latency
+            while len(items) < target and not self._closed and \
+                    self._error is None:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                await self._wait(target, timeout)
+
+        if max_items is None or max_items >= len(items):
+            batch = list(items)
+            items.clear()
+        else:
+            batch = [items.popleft() for _ in range(max_items)]
+        return batch
+
+
+def _release_waiter(waiter: asyncio.Future):
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+def _signal_name(signal) -> str:
+    """Return the signature of a bound signal, e.g. 'timeout()', or the
+    name of a signal-like object."""
+    signature = getattr(signal, 'signal', None)
+    if isinstance(signature, str):
+        # PyQt prefixes the signature with a code ('2' for signals).
+        return signature[1:]
+    # multisignal, debounce and throttle objects carry a name.
+    name = getattr(signal, 'name', None)
+    if isinstance(name, str):
+        return name
+    # PySide's representation is '<PySide6.QtCore.SignalInstance
+    # timeout() at 0x...>'.
+    parts = repr(signal).split(' ')
+    return parts[1] if len(parts) == 4 else type(signal).__name__
+
+
+def _copy_retaining_byte_arrays(args: tuple) -> tuple:
+    """Copy signal arguments, taking a private (shallow) copy of any
+    QByteArray argument even if the binding passes the sender's object,
+    because the sender must not modify a QByteArray whose buffer is
+    exported."""
+    from .bindings import QtCore
+    byte_array_type = QtCore.QByteArray
+    return tuple(byte_array_type(arg) if type(arg) is byte_array_type
+                 else arg for arg in copy_signal_arguments(args))
 
 
 class asyncsignalstream:
-    def __init__(self, signal):
-        from .bindings import _QiSlotObject
-        self._queue = asyncio.Queue()
-        self._slot = _QiSlotObject(
-            functools.partial(_asyncsignalstream_handle, self._queue))
+    def __init__(self, signal, *, maxsize: int = 0,
+                 overflow: str = 'drop_oldest',
+                 reducer: Optional[Callable[[tuple, tuple], tuple]] = None,
+                 predicate: Optional[Callable[..., bool]] = None,
+                 zero_copy: bool = False,
+                 name: Optional[str] = None):
+        from .bindings import QtCore, _QiSlotObject
+        if overflow not in _OVERFLOW_POLICIES:
+            raise ValueError(f'asyncsignalstream: unknown overflow policy '
+                             f'{overflow!r}')
+        if (overflow == 'coalesce') != (reducer is not None):
+            raise ValueError("asyncsignalstream: reducer must be given if "
+                             "and only if overflow is 'coalesce'")
+        if overflow == 'latest_only':
+            if maxsize > 1:
+                raise ValueError("asyncsignalstream: maxsize must be 0 or 1 "
+                                 "if overflow is 'latest_only'")
+            maxsize = 1
+        self._buffer = _SignalBuffer(
+            maxsize, overflow, reducer, predicate,
+            copy=_copy_retaining_byte_arrays if zero_copy
+            else copy_signal_arguments,
+            name=name if name is not None else _signal_name(signal))
+        self._slot = _QiSlotObject(self._buffer.handle)
         signal.connect(self._slot.slot)
+        self._byte_array_type = QtCore.QByteArray if zero_copy else None
 
-    def __aiter__(self):
+    def _export(self, args: tuple) -> tuple:
+        # Export the buffer of QByteArray arguments only when consumed:
+        # the sender has usually released its reference to the data by
+        # then, so that the data is not shared and need not be detached
+        # (i.e. deep copied) for export.
+        byte_array_type = self._byte_array_type
+        if byte_array_type is None:
+            return args
+        return tuple(memoryview(arg) if type(arg) is byte_array_type
+                     else arg for arg in args)
+
+    @staticmethod
+    def get_debug_counters() -> Dict[str, int]:
+        """Return the number of streams that are not closed and the total
+        number of emissions buffered in them, to help find leaks."""
+        buffers = list(_open_buffers)
+        return {
+            'streams': len(buffers),
+            'queued': sum(len(buffer._items) for buffer in buffers),
+        }
+
+    @property
+    def dropped(self) -> int:
+        """Number of emissions dropped or coalesced on overflow."""
+        return self._buffer.dropped
+
+    def close(self) -> None:
+        """Disconnect from the signal and discard buffered emissions.
+        Pending and subsequent iterations end."""
+        # Deleting the slot object closes the connection.  Unlike calling
+        # disconnect(), this works even if the sender is already deleted,
+        # and does not require keeping a reference to the sender.
+        self._slot = None
+        self._buffer.close()
+
+    async def aclose(self) -> None:
+        self.close()
+
+    async def __aenter__(self):
         return self
 
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __aiter__(self):
+        # Iterate through an async generator, so that the stream is
+        # closed when an `async for` loop over it is exited early.
+        return self._iterate()
+
+    async def _iterate(self):
+        try:
+            while True:
+                args = await self._buffer.get()
+                if args is None:
+                    return
+                yield self._export(args)
+        finally:
+            self.close()
+
     async def __anext__(self):
-        return await self._queue.get()
+        args = await self._buffer.get()
+        if args is None:
+            raise StopAsyncIteration
+        return self._export(args)
+
+    def batches(self, max_items: Optional[int] = None,
+                max_latency: float = 0) -> AsyncIterator[List[tuple]]:
+        """Return an asynchronous iterator that produces lists of emitted
+        arguments, each holding everything buffered (up to max_items)."""
+        if max_items is not None and max_items < 1:
+            raise ValueError('batches: max_items must be positive')
+        if max_latency < 0:
+            raise ValueError('batches: max_latency must be non-negative')
+        return self._batches(max_items, max_latency)
+
+    async def _batches(self, max_items, max_latency):
+        try:
+            while True:
+                batch = await self._buffer.get_batch(max_items, max_latency)
+                if not batch:
+                    return
+                if self._byte_array_type is not None:
+                    batch = [self._export(args) for args in batch]
+                yield batch
+        finally:
+            self.close()
+
+
+class SignalListener:
+    """Persistent connection to a signal for awaiting emissions repeatedly.
+
+    Unlike asyncsignal(), which creates a slot object and a connection for
+    each await, a listener stays connected until it is closed.
+    """
+
+    def __init__(self, signal, *, buffered: bool = False,
+                 predicate: Optional[Callable[..., bool]] = None):
+        from .bindings import _QiSlotObject
+        self._buffer = _SignalBuffer(0, 'drop_oldest', None, predicate,
+                                     buffer_unwaited=buffered)
+        # Only streams are reported by asyncsignalstream.get_debug_counters.
+        _open_buffers.discard(self._buffer)
+        self._slot = _QiSlotObject(self._buffer.handle)
+        signal.connect(self._slot.slot)
+
+    @property
+    def dropped(self) -> int:
+        """Number of emissions dropped because no wait() was pending."""
+        return self._buffer.dropped
+
+    async def wait(self, timeout: Optional[float] = None) -> tuple:
+        """Return the arguments of the next emission.  If the listener
+        is buffered, return the oldest emission not yet waited for."""
+        args = await self._buffer.get(timeout)
+        if args is None:
+            raise RuntimeError('SignalListener is closed')
+        return args
+
+    def close(self) -> None:
+        """Disconnect from the signal.  Pending and subsequent wait()
+        raise RuntimeError."""
+        self._slot = None
+        self._buffer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+# Ports of the multisignal connections to bound method slots, keyed by
+# the id() of the tuple holding them.  Signals hold weak references to
+# the ports, which are kept alive here until the receiver of the slot is
+# deleted; deleting the ports then closes the connections.
+_multisignal_ports: Dict[int, tuple] = dict()
 
 
-def _emit_multisignal(slot, args, value):
-    slot(value, copy_signal_arguments(args))
+class _MultiSignalDispatcher:
+    """Relays the emissions of the signals of a multisignal to a slot
+    along with the tag of the emitting signal, looked up by its index."""
+
+    __slots__ = '_slot', '_weak', '_tags', '_names'
+
+    def __init__(self, slot, weak: bool, tags: tuple, names: tuple):
+        self._slot = slot
+        self._weak = weak
+        self._tags = tags
+        self._names = names
+
+    def dispatch(self, index: int, *args):
+        slot = self._slot() if self._weak else self._slot
+        if slot is not None:
+            stats = _stats._signal_stats
+            if stats is not None:
+                stats.stream(self._names[index]).emissions += 1
+            slot(self._tags[index], copy_signal_arguments(args))
+
+
+class _MultiSignalPort:
+    """Receiver of one signal of a multisignal connected to a bound
+    method slot.  Its bound method relay is connected to the signal so
+    that the connection is closed when the port is deleted."""
+
+    __slots__ = '_dispatch', '_index', '__weakref__'
+
+    def __init__(self, dispatch, index: int):
+        self._dispatch = dispatch
+        self._index = index
+
+    def relay(self, *args):
+        self._dispatch(self._index, *args)
 
 
 class multisignal:
-    def __init__(self, signal_map):
+    def __init__(self, signal_map, *, name: str = 'multisignal'):
         self.signal_map = signal_map
+        self.name = name
 
     def connect(self, slot) -> None:
-        for signal, value in self.signal_map.items():
-            wrapper = transform_slot(slot, _emit_multisignal, value)
-            signal.connect(wrapper)
+        # All signals share one dispatcher holding the tags in a tuple.
+        tags = tuple(self.signal_map.values())
+        names = tuple(f'{self.name}[{tag!r}]' for tag in tags)
+        if hasattr(slot, '__self__') and \
+                getattr(slot, '__func__', None) is not None:
+            # slot is a method object.  Close the connections when its
+            # receiver object is deleted, like transform_slot does.
+            dispatcher = _MultiSignalDispatcher(None, True, tags, names)
+            ports = tuple(_MultiSignalPort(dispatcher.dispatch, index)
+                          for index in range(len(tags)))
+            key = id(ports)
+            dispatcher._slot = weakref.WeakMethod(
+                slot, functools.partial(_multisignal_ports.pop, key))
+            _multisignal_ports[key] = ports
+            for signal, port in zip(self.signal_map, ports):
+                signal.connect(port.relay)
+        else:
+            # Keep a strong reference to slot for as long as the signals
+            # keep their connections.
+            dispatcher = _MultiSignalDispatcher(slot, False, tags, names)
+            for index, signal in enumerate(self.signal_map):
+                signal.connect(functools.partial(dispatcher.dispatch, index))
+
+
+class _RateLimiter:
+    """Timing state of a debounce or throttle object.
+
+    This object is referenced by the slot object connected to the source
+    signal, and must not reference the debounce or throttle object in
+    turn, so that deleting the latter closes the connection.  The timers
+    are connected to bound methods of this object, which the bindings
+    hold by weak reference.
+    """
+
+    def __init__(self, ms: int, throttling: bool, leading: bool,
+                 trailing: bool):
+        from .bindings import QtCore
+        self._throttling = throttling
+        self._leading = leading
+        self._trailing = trailing
+        self._pending = False
+        self.args: tuple = ()
+        # Times the quiet period or the throttling window.
+        self._timer = QtCore.QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(ms)
+        self._timer.timeout.connect(self._on_timeout)
+        # "Reuse" QtCore.QTimer.timeout as a parameterless signal to
+        # deliver emissions to the connected slots.
+        self.relay = QtCore.QTimer()
+
+    # Under PyQt5/6 the arguments of an emission are only valid until the
+    # handler returns, so those of an emission that may be passed on
+    # later are copied when it arrives; it is not known then whether a
+    # later emission will replace it.  A leading emission is passed on
+    # before the handler returns and is not copied.
+
+    def handle_debounce(self, *args):
+        self.args = copy_signal_arguments(args)
+        self._pending = True
+        self._timer.start()  # restarts the timer if active
+
+    def handle_throttle(self, *args):
+        if not self._timer.isActive():
+            self._timer.start()
+            if self._leading:
+                self.args = args
+                try:
+                    self.relay.timeout.emit()
+                finally:
+                    self.args = ()
+                return
+        if self._trailing:
+            self.args = copy_signal_arguments(args)
+            self._pending = True
+
+    def _on_timeout(self):
+        if self._pending:
+            self._pending = False
+            if self._throttling:
+                # The trailing emission starts a new throttling window.
+                self._timer.start()
+            try:
+                self.relay.timeout.emit()
+            finally:
+                self.args = ()
+
+
+def _emit_rate_limited(slot, args, state_ref):
+    state = state_ref()
+    if state is not None:
+        slot(*state.args)
+
+
+class _RateLimitedSignal:
+    def __init__(self, signal, ms: int, throttling: bool,
+                 leading: bool = False, trailing: bool = True):
+        from .bindings import _QiSlotObject
+        if ms < 0:
+            raise ValueError(f'{type(self).__name__}: ms must be '
+                             f'non-negative')
+        self._state = _RateLimiter(ms, throttling, leading, trailing)
+        handle = self._state.handle_throttle if throttling else \
+            self._state.handle_debounce
+        self._slot = _QiSlotObject(handle)
+        signal.connect(self._slot.slot)
+        self.name = f'{type(self).__name__}({_signal_name(signal)})'
+
+    def connect(self, slot) -> None:
+        """Connect slot to be called with the arguments of each emission
+        that passes through."""
+        self._state.relay.timeout.connect(transform_slot(
+            slot, _emit_rate_limited, weakref.ref(self._state)))
+
+
+class debounce(_RateLimitedSignal):
+    def __init__(self, signal, ms: int):
+        super().__init__(signal, ms, False)
+
+
+class throttle(_RateLimitedSignal):
+    def __init__(self, signal, ms: int, *, leading: bool = True,
+                 trailing: bool = True):
+        if not leading and not trailing:
+            raise ValueError('throttle: at least one of leading and '
+                             'trailing must be true')
+        super().__init__(signal, ms, True, leading, trailing)
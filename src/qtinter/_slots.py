@@ -1,12 +1,18 @@
 """ _slot.py - definition of helper functions """
 
 import asyncio
-from typing import Callable, Coroutine, Set
+import collections
+import functools
+import time
+import weakref
+from typing import Callable, Coroutine, Deque, Dict, Optional, Set
 from ._tasks import run_task
 from ._helpers import get_positional_parameter_count, transform_slot
+from ._signals import copy_signal_arguments
+from . import _stats
 
 
-__all__ = 'asyncslot',
+__all__ = 'asyncslot', 'TaskScope',
 
 
 # Global variable to store strong reference to tasks created by asyncslot()
@@ -26,13 +32,236 @@ def _run_coroutine_function(fn, args, param_count, task_runner):
     else:
         coro = fn(*args)
 
-    task = task_runner(coro)  # TODO: set name and context
+    stats = _stats._signal_stats
+    if stats is None:
+        task = task_runner(coro)  # TODO: set name and context
+    else:
+        task = _run_profiled(stats, fn, coro, task_runner)
     _running_tasks.add(task)
     task.add_done_callback(_running_tasks.discard)
     return task
 
 
-def asyncslot(fn: CoroutineFunction, *, task_runner=run_task):
+def _slot_name(fn) -> str:
+    name = getattr(fn, '__qualname__', None)
+    if name is None:
+        # e.g. functools.partial
+        name = getattr(getattr(fn, 'func', None), '__qualname__', None)
+    return name if name is not None else repr(fn)
+
+
+def _run_profiled(stats, fn, coro, task_runner) -> asyncio.Task:
+    slot_stats = stats.slot(_slot_name(fn))
+    slot_stats.invocations += 1
+    start_time = time.perf_counter()
+    task = task_runner(_profile(coro, slot_stats, start_time))
+    slot_stats.eager_time.add(time.perf_counter() - start_time)
+    slot_stats.in_flight += 1
+    task.add_done_callback(
+        functools.partial(_record_task_done, slot_stats, coro))
+    return task
+
+
+async def _profile(coro, slot_stats, start_time):
+    # Count exceptions here instead of in the done callback, because
+    # calling task.exception() would suppress the 'exception was never
+    # retrieved' log message.  Timing here also leaves out the delay of
+    # the done callback.
+    try:
+        return await coro
+    except asyncio.CancelledError:
+        raise
+    except BaseException:
+        slot_stats.exceptions += 1
+        raise
+    finally:
+        slot_stats.task_time.add(time.perf_counter() - start_time)
+
+
+def _record_task_done(slot_stats, coro, task: asyncio.Task):
+    slot_stats.in_flight -= 1
+    if task.cancelled():
+        slot_stats.cancelled += 1
+        # If the task was cancelled before it started, e.g. by a closed
+        # TaskScope, _profile never awaited coro.  Close it so that it is
+        # not reported as never awaited; this is a no-op otherwise.
+        coro.close()
+
+
+_POLICIES = ('drop_while_running', 'queue', 'restart')
+
+
+class _ConcurrencyLimiter:
+    """Applies a concurrency policy to the tasks started by asyncslot().
+
+    At most max_concurrency tasks run at the same time.  What happens
+    to a call when that many tasks are running depends on the policy:
+    'drop_while_running' ignores it, 'queue' defers it until a task
+    finishes (ignoring it if max_queued calls are already deferred),
+    and 'restart' cancels the oldest running task to make room.
+    """
+
+    def __init__(self, policy: str, max_concurrency: int,
+                 max_queued: Optional[int]):
+        self._policy = policy
+        self._max_concurrency = max_concurrency
+        self._max_queued = max_queued
+        # Used as an ordered set.
+        self._running: Dict[asyncio.Task, None] = dict()
+        self._queued: Deque[tuple] = collections.deque()
+
+    def run(self, fn, args, param_count, task_runner) \
+            -> Optional[asyncio.Task]:
+        if len(self._running) >= self._max_concurrency:
+            if self._policy == 'drop_while_running':
+                return None
+            if self._policy == 'queue':
+                if self._max_queued is None or \
+                        len(self._queued) < self._max_queued:
+                    # The arguments must outlive the slot call.  Create
+                    # the coroutine when it is started, so that dropped
+                    # calls leave no never-awaited coroutine behind.
+                    self._queued.append((fn, copy_signal_arguments(args),
+                                         param_count, task_runner))
+                return None
+            # restart
+            oldest = next(iter(self._running))
+            del self._running[oldest]
+            oldest.cancel()
+        return self._start(fn, args, param_count, task_runner)
+
+    def _start(self, fn, args, param_count, task_runner) -> asyncio.Task:
+        task = _run_coroutine_function(fn, args, param_count, task_runner)
+        self._running[task] = None
+        task.add_done_callback(self._on_done)
+        return task
+
+    def _on_done(self, task: asyncio.Task):
+        self._running.pop(task, None)
+        while self._queued and len(self._running) < self._max_concurrency:
+            self._start(*self._queued.popleft())
+
+
+def _run_limited(fn, args, param_count, task_runner, limiter):
+    return limiter.run(fn, args, param_count, task_runner)
+
+
+# Concurrency limiters of bound method slots, keyed by the id() of the
+# receiver object and then by (function, policy arguments), so that
+# wrapping the same method again shares the limiter.  An entry is
+# removed when its receiver object is finalized.
+_receiver_limiters: Dict[int, Dict[tuple, _ConcurrencyLimiter]] = dict()
+
+
+def _get_limiter(fn, policy: str, max_concurrency: int,
+                 max_queued: Optional[int]) -> _ConcurrencyLimiter:
+    receiver = getattr(fn, '__self__', None)
+    func = getattr(fn, '__func__', None)
+    if receiver is None or func is None:
+        return _ConcurrencyLimiter(policy, max_concurrency, max_queued)
+
+    limiters = _receiver_limiters.get(id(receiver))
+    if limiters is None:
+        limiters = dict()
+        try:
+            weakref.finalize(receiver, _receiver_limiters.pop,
+                             id(receiver), None)
+        except TypeError:  # receiver does not support weak reference
+            return _ConcurrencyLimiter(policy, max_concurrency, max_queued)
+        _receiver_limiters[id(receiver)] = limiters
+
+    key = (func, policy, max_concurrency, max_queued)
+    limiter = limiters.get(key)
+    if limiter is None:
+        limiter = limiters[key] = _ConcurrencyLimiter(
+            policy, max_concurrency, max_queued)
+    return limiter
+
+
+class TaskScope:
+    """Group of tasks that are cancelled when a QObject is destroyed.
+
+    The scope does not keep the QObject alive.  The scope is kept alive
+    by its member tasks and by the asyncslot() wrappers using it, and
+    closes the connection to the destroyed signal when it is deleted.
+    """
+
+    def __init__(self, qobject):
+        from .bindings import _QiSlotObject
+        self._tasks: Set[asyncio.Task] = set()
+        self._closed = False
+        self.cancelled = 0
+        # Bindings never release a callable connected to a signal other
+        # than a bound method, even after the sender is deleted, so relay
+        # the signal through a slot object referencing the scope weakly.
+        self._slot = _QiSlotObject(
+            functools.partial(_close_scope, weakref.ref(self)))
+        qobject.destroyed.connect(self._slot.slot)
+
+    @property
+    def closed(self) -> bool:
+        """True if the QObject has been destroyed."""
+        return self._closed
+
+    def __len__(self):
+        return len(self._tasks)
+
+    def add(self, task: asyncio.Task) -> asyncio.Task:
+        """Add task to the scope and return it.  If the scope is closed,
+        cancel task."""
+        if self._closed:
+            if task.cancel():
+                self.cancelled += 1
+        elif not task.done():
+            self._tasks.add(task)
+            task.add_done_callback(self._discard)
+        return task
+
+    def _discard(self, task: asyncio.Task):
+        self._tasks.discard(task)
+
+    def create_task(self, coro, **kwargs) -> asyncio.Task:
+        """Schedule the execution of coro in a task added to the scope.
+        If the scope is closed, the task is cancelled before it runs."""
+        return self.add(asyncio.create_task(coro, **kwargs))
+
+    def cancel(self) -> int:
+        """Cancel the tasks of the scope and return their number."""
+        count = 0
+        for task in list(self._tasks):
+            if task.cancel():
+                count += 1
+        self.cancelled += count
+        return count
+
+    def _close(self):
+        self._closed = True
+        self.cancel()
+
+    def __repr__(self):
+        state = 'closed' if self._closed else 'open'
+        return (f'<{type(self).__name__} {state} tasks={len(self._tasks)} '
+                f'cancelled={self.cancelled}>')
+
+
+def _close_scope(scope_ref, *args):
+    scope = scope_ref()
+    if scope is not None:
+        scope._close()
+
+
+def _run_in_scope(scope: TaskScope, task_runner, coro) -> asyncio.Task:
+    if scope.closed:
+        # Do not run any part of the coroutine.
+        return scope.create_task(coro)
+    return scope.add(task_runner(coro))
+
+
+def asyncslot(fn: CoroutineFunction, *, task_runner=run_task,
+              policy: Optional[str] = None,
+              max_concurrency: Optional[int] = None,
+              max_queued: Optional[int] = None,
+              scope: Optional[TaskScope] = None):
     """Wrap coroutine function to make it usable as a Qt slot.
 
     If fn is a bound method object, the returned wrapper will also be a
@@ -45,6 +274,20 @@ def asyncslot(fn: CoroutineFunction, *, task_runner=run_task):
        the wrapper is kept alive until fn is garbage collected.  This
        will automatically disconnect any connection connected to the
        wrapper.
+
+    If policy is given, at most max_concurrency (default 1) tasks
+    started by the wrapper run at the same time, and policy determines
+    what happens to a call when that many are running; see
+    _ConcurrencyLimiter.  Such a call returns None instead of a task.
+    For a bound method, this state is shared by all wrappers of the
+    same method and policy on the same receiver object.
+
+    If scope is given, the tasks are added to it, so that they are
+    cancelled when its QObject is destroyed.  Tasks created after that
+    are cancelled before they run.
+
+    While a QiSignalStats object is installed by set_signal_stats(),
+    the tasks are profiled under the qualified name of fn.
     """
     if not callable(fn):
         raise TypeError(f'asyncslot expects a coroutine function, '
@@ -56,4 +299,29 @@ def asyncslot(fn: CoroutineFunction, *, task_runner=run_task):
     # Work around this by "truncating" input parameters if needed.
     param_count = get_positional_parameter_count(fn)
 
-    return transform_slot(fn, _run_coroutine_function, param_count, task_runner)
+    if scope is not None:
+        task_runner = functools.partial(_run_in_scope, scope, task_runner)
+
+    if policy is None:
+        if max_concurrency is not None or max_queued is not None:
+            raise ValueError('asyncslot: max_concurrency and max_queued '
+                             'require a policy')
+        return transform_slot(fn, _run_coroutine_function, param_count,
+                              task_runner)
+
+    if policy not in _POLICIES:
+        raise ValueError(f'asyncslot: unknown policy {policy!r}')
+    if max_concurrency is None:
+        max_concurrency = 1
+    elif max_concurrency < 1:
+        raise ValueError('asyncslot: max_concurrency must be positive')
+    if max_queued is not None:
+        if policy != 'queue':
+            raise ValueError("asyncslot: max_queued requires policy "
+                             "'queue'")
+        if max_queued < 0:
+            raise ValueError('asyncslot: max_queued must be non-negative')
+
+    limiter = _get_limiter(fn, policy, max_concurrency, max_queued)
+    return transform_slot(fn, _run_limited, param_count, task_runner,
+                          limiter)
@@ -0,0 +1,265 @@
+"""Opt-in statistics collected by QiBaseEventLoop and by the signal and
+slot helpers"""
+
+import asyncio
+import bisect
+import logging
+import time
+from typing import Callable, Dict, Optional, Sequence
+
+
+__all__ = (
+    'QiHistogram', 'QiLoopStats', 'QiSlotStats', 'QiStreamStats',
+    'QiSignalStats', 'get_signal_stats', 'set_signal_stats',
+    'report_signal_stats',
+)
+
+
+class QiHistogram:
+    """Histogram with fixed bucket upper bounds.
+
+    A value v is counted in bucket i if bounds[i-1] < v <= bounds[i];
+    values greater than the last bound are counted in an extra overflow
+    bucket, so that len(counts) == len(bounds) + 1.
+    """
+
+    __slots__ = 'bounds', 'counts', 'count', 'total',
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0
+
+    def add(self, value) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def reset(self) -> None:
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0
+
+    def __repr__(self):
+        return (f'<{type(self).__name__} count={self.count} '
+                f'mean={self.mean():g} counts={self.counts}>')
+
+
+# Bucket bounds for durations, in seconds: 10us to 1s in decades.
+_TIME_BOUNDS = (1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0)
+
+# Bucket bounds for queue depths.
+_DEPTH_BOUNDS = (0, 1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+
+
+class QiLoopStats:
+    """Counters and histograms describing the work of a QiBaseEventLoop.
+
+    Install an instance with QiBaseEventLoop.set_stats() to start
+    collecting.  All counters are updated in place; call reset() to
+    start over.
+    """
+
+    def __init__(self):
+        # Number of _qi_loop_iteration calls, i.e. Qt notifications handled.
+        self.iterations = 0
+
+        # Number of times select() yielded to the Qt event loop.
+        self.yields = 0
+
+        # Number of wakeups of the selector through the self-pipe.
+        self.wakeups = 0
+
+        # Time between select() yielding and the selector signaling that
+        # IO is ready or the timeout is reached.
+        self.select_time = QiHistogram(_TIME_BOUNDS)
+
+        # Time between the selector signaling and the loop being notified
+        # by the Qt event loop, i.e. the Qt event queue latency.
+        self.notify_latency = QiHistogram(_TIME_BOUNDS)
+
+        # Length of the ready queue at the start of each _run_once().
+        self.ready_depth = QiHistogram(_DEPTH_BOUNDS)
+
+    def reset(self) -> None:
+        self.iterations = 0
+        self.yields = 0
+        self.wakeups = 0
+        self.select_time.reset()
+        self.notify_latency.reset()
+        self.ready_depth.reset()
+
+    def __repr__(self):
+        return (f'<{type(self).__name__} iterations={self.iterations} '
+                f'yields={self.yields} wakeups={self.wakeups} '
+                f'select_time={self.select_time!r} '
+                f'notify_latency={self.notify_latency!r} '
+                f'ready_depth={self.ready_depth!r}>')
+
+
+class QiSlotStats:
+    """Statistics of the tasks started by asyncslot() wrappers of
+    coroutine functions with the same qualified name."""
+
+    def __init__(self):
+        # Number of tasks started.
+        self.invocations = 0
+
+        # Number of tasks started and not yet completed.  This is a gauge
+        # and is not cleared by reset().
+        self.in_flight = 0
+
+        # Number of tasks that completed by cancellation or exception.
+        self.cancelled = 0
+        self.exceptions = 0
+
+        # Time taken by the task runner, i.e. the eager first step when
+        # the task runner is run_task.
+        self.eager_time = QiHistogram(_TIME_BOUNDS)
+
+        # Time between starting a task and its coroutine returning or
+        # raising.
+        self.task_time = QiHistogram(_TIME_BOUNDS)
+
+    def reset(self) -> None:
+        self.invocations = 0
+        self.cancelled = 0
+        self.exceptions = 0
+        self.eager_time.reset()
+        self.task_time.reset()
+
+    def __repr__(self):
+        return (f'<{type(self).__name__} invocations={self.invocations} '
+                f'in_flight={self.in_flight} cancelled={self.cancelled} '
+                f'exceptions={self.exceptions} '
+                f'eager_time={self.eager_time!r} '
+                f'task_time={self.task_time!r}>')
+
+
+class QiStreamStats:
+    """Statistics of the emissions received by asyncsignalstream objects
+    or multisignal connections with the same name."""
+
+    def __init__(self):
+        # Number of emissions received, after any predicate.
+        self.emissions = 0
+
+        # Number of emissions already buffered when an emission is
+        # received.  Not collected for multisignal.
+        self.queue_depth = QiHistogram(_DEPTH_BOUNDS)
+
+        self._start_time = time.monotonic()
+
+    def rate(self) -> float:
+        """Return the number of emissions per second since creation or
+        the last reset()."""
+        elapsed = time.monotonic() - self._start_time
+        return self.emissions / elapsed if elapsed > 0 else 0.0
+
+    def reset(self) -> None:
+        self.emissions = 0
+        self.queue_depth.reset()
+        self._start_time = time.monotonic()
+
+    def __repr__(self):
+        return (f'<{type(self).__name__} emissions={self.emissions} '
+                f'rate={self.rate():g} queue_depth={self.queue_depth!r}>')
+
+
+class QiSignalStats:
+    """Statistics collected by asyncslot(), asyncsignalstream and
+    multisignal, keyed by slot or stream name.
+
+    Install an instance with set_signal_stats() to start collecting.
+    """
+
+    def __init__(self):
+        self.slots: Dict[str, QiSlotStats] = dict()
+        self.streams: Dict[str, QiStreamStats] = dict()
+
+    def slot(self, name: str) -> QiSlotStats:
+        """Return the statistics of slot name, creating it if needed."""
+        stats = self.slots.get(name)
+        if stats is None:
+            stats = self.slots[name] = QiSlotStats()
+        return stats
+
+    def stream(self, name: str) -> QiStreamStats:
+        """Return the statistics of stream name, creating it if needed."""
+        stats = self.streams.get(name)
+        if stats is None:
+            stats = self.streams[name] = QiStreamStats()
+        return stats
+
+    def reset(self) -> None:
+        for stats in self.slots.values():
+            stats.reset()
+        for stats in self.streams.values():
+            stats.reset()
+
+    def summary(self, limit: Optional[int] = 10) -> str:
+        """Return a table of the slots with the most total task time and
+        of the streams with the highest emission rate, up to limit rows
+        each."""
+        lines = [f'{"slot":<40}{"calls":>8}{"active":>8}{"cancel":>8}'
+                 f'{"error":>8}{"eager ms":>10}{"task ms":>10}']
+        slots = sorted(self.slots.items(),
+                       key=lambda item: item[1].task_time.total,
+                       reverse=True)
+        for name, stats in slots[:limit]:
+            lines.append(f'{name:<40}{stats.invocations:8d}'
+                         f'{stats.in_flight:8d}{stats.cancelled:8d}'
+                         f'{stats.exceptions:8d}'
+                         f'{stats.eager_time.mean() * 1e3:10.3f}'
+                         f'{stats.task_time.mean() * 1e3:10.3f}')
+        lines.append(f'{"stream":<40}{"emitted":>8}{"rate/s":>10}'
+                     f'{"depth":>8}')
+        streams = [(name, stats, stats.rate())
+                   for name, stats in self.streams.items()]
+        streams.sort(key=lambda item: item[2], reverse=True)
+        for name, stats, rate in streams[:limit]:
+            lines.append(f'{name:<40}{stats.emissions:8d}{rate:10.1f}'
+                         f'{stats.queue_depth.mean():8.1f}')
+        return '\n'.join(lines)
+
+    def __repr__(self):
+        return (f'<{type(self).__name__} slots={len(self.slots)} '
+                f'streams={len(self.streams)}>')
+
+
+# Statistics to update, or None if not collecting.  Read by _slots and
+# _signals on every call, so keep it a plain module attribute.
+_signal_stats: Optional[QiSignalStats] = None
+
+
+def set_signal_stats(stats: Optional[QiSignalStats]) -> None:
+    """Start collecting signal and slot statistics into stats, or stop
+    collecting if stats is None."""
+    global _signal_stats
+    _signal_stats = stats
+
+
+def get_signal_stats() -> Optional[QiSignalStats]:
+    return _signal_stats
+
+
+async def report_signal_stats(
+        interval: float,
+        report: Optional[Callable[[str], None]] = None,
+        *, reset: bool = False) -> None:
+    """Pass the summary of the installed signal statistics to report
+    (by default, log it to the 'qtinter' logger) every interval seconds,
+    until cancelled."""
+    if report is None:
+        report = logging.getLogger('qtinter').info
+    while True:
+        await asyncio.sleep(interval)
+        stats = _signal_stats
+        if stats is not None:
+            report(stats.summary())
+            if reset:
+                stats.reset()
@@ -1,9 +1,15 @@
 import asyncio
+import sys
 
 
 __all__ = "run_task",
 
 
+# Python 3.12 can execute the first step of a task when the task is
+# created, switching the current task natively.
+_NATIVE_EAGER_START = sys.version_info >= (3, 12)
+
+
 def run_task(coro, *, allow_task_nesting=True, **kwargs):
     """Create a Task and eagerly executes the first step."""
 
@@ -19,6 +25,13 @@ def run_task(coro, *, allow_task_nesting=True, **kwargs):
         raise RuntimeError("cannot call run_task from a running task "
                            "when allow_task_nesting is False")
 
+    if _NATIVE_EAGER_START and loop.get_task_factory() is None:
+        # The task 'suspends' and 'resumes' the calling task itself, and
+        # a coroutine that completes in the first step is never scheduled.
+        # A custom task factory must be honored, so it takes the path
+        # below instead.
+        return asyncio.Task(coro, loop=loop, eager_start=True, **kwargs)
+
     # asyncio.create_task() schedules asyncio.Task.__step to the end of the
     # loop's _ready queue.
     ntodo = len(loop._ready)
@@ -7,6 +7,9 @@ if sys.platform == 'win32':
 
 
 import asyncio.unix_events
+import selectors
+from typing import List, Optional, Tuple
+from ._selectable import _QiNotifier, _QiSelectable
 from . import _selector_events
 
 
@@ -15,9 +18,110 @@ __all__ = (
     'QiDefaultEventLoopPolicy',
     'QiSelectorEventLoop',
     'QiSelectorEventLoopPolicy',
+    'QiSocketNotifierSelector',
 )
 
 
+class QiSocketNotifierSelector(_QiSelectable, selectors.BaseSelector):
+    """Selector that waits for IO on the Qt event loop instead of in a
+    worker thread.
+
+    The wrapped selector must expose a pollable file descriptor through
+    fileno(), which is the case for EpollSelector, KqueueSelector and
+    DevpollSelector.  When select() would block, that file descriptor
+    is watched by a QSocketNotifier and the timeout is tracked by a
+    single-shot QTimer; whichever fires first notifies the event loop.
+
+    Because the real selector is only ever accessed from the loop's
+    thread, register(), unregister() and modify() take effect at once
+    without having to wake up a blocked select().
+    """
+
+    def __init__(self, selector: Optional[selectors.BaseSelector] = None):
+        super().__init__()
+        if selector is None:
+            selector = selectors.DefaultSelector()
+        if not hasattr(selector, 'fileno'):
+            raise TypeError(f'QiSocketNotifierSelector requires a selector '
+                            f'with a pollable file descriptor, but got '
+                            f'{selector!r}')
+        self._selector = selector
+        self._notifier: Optional[_QiNotifier] = None
+        self._waiter: Optional[_selector_events._QiQtWaiter] = None
+        self._closed = False
+
+    def set_notifier(self, notifier: Optional[_QiNotifier]) -> None:
+        assert not self._closed, 'selector already closed'
+        if self._waiter is not None:
+            # Go back to IDLE state; the previous notifier is still
+            # signaled as required by the protocol.
+            self._waiter.cancel()
+
+        self._notifier = notifier
+        if notifier is None:
+            if self._waiter is not None:
+                self._waiter.close()
+            self._waiter = None
+        elif self._waiter is None:
+            # Create the Qt objects in the thread that runs the loop.
+            self._waiter = _selector_events._QiQtWaiter()
+
+    def register(self, fileobj, events, data=None):
+        return self._selector.register(fileobj, events, data)
+
+    def unregister(self, fileobj):
+        return self._selector.unregister(fileobj)
+
+    def modify(self, fileobj, events, data=None):
+        return self._selector.modify(fileobj, events, data)
+
+    def select(self, timeout: Optional[float] = None) \
+            -> List[Tuple[selectors.SelectorKey, int]]:
+        assert not self._closed, 'selector already closed'
+
+        # Perform normal (blocking) select if no notifier is set.
+        if self._notifier is None:
+            return self._selector.select(timeout)
+
+        assert not self._waiter.is_waiting(), 'unexpected select'
+
+        # Ctrl+C pressed while the selector was BUSY is delivered here,
+        # just like a native select() would raise KeyboardInterrupt.
+        self._waiter.check_interrupted()
+
+        # Try select with zero timeout, and return if any IO is ready or
+        # timeout is zero.
+        event_list = self._selector.select(0)
+        if event_list or timeout == 0:
+            return event_list
+
+        # No IO is ready and caller wants to wait.  Let the Qt event loop
+        # watch the selector's file descriptor and tell the caller to yield.
+        self._waiter.wait([(self._selector.fileno(), selectors.EVENT_READ)],
+                          timeout, self._notifier.notify)
+        return self._notifier.no_result()  # raises _QiYield
+
+    def close(self) -> None:
+        # close() is called when the loop is being closed, and the loop
+        # can only be closed when it is in STOPPED state.  In this state
+        # the selector must be idle.
+        if self._closed:  # pragma: no cover
+            return
+
+        if self._waiter is not None:
+            self._waiter.close()
+            self._waiter = None
+        self._selector.close()
+        self._notifier = None
+        self._closed = True
+
+    def get_key(self, fileobj):
+        return self._selector.get_key(fileobj)
+
+    def get_map(self):
+        return self._selector.get_map()
+
+
 class QiSelectorEventLoop(
     _selector_events.QiBaseSelectorEventLoop,
     asyncio.unix_events.SelectorEventLoop
@@ -3,6 +3,8 @@
 import importlib
 import os
 import sys
+import weakref
+from typing import Optional
 
 
 __all__ = 'QtCore',
@@ -51,26 +53,86 @@ def __getattr__(name: str):
     return importlib.import_module(f"{binding}.{name}")
 
 
+# Event type used by _QiObjectImpl to post notifications with a priority.
+_QI_NOTIFY_EVENT_TYPE = QtCore.QEvent.Type(QtCore.QEvent.registerEventType())
+
+
+class _QiEventReceiver(QtCore.QObject):
+    """Receives the events posted by a _QiObjectImpl."""
+
+    def __init__(self, callback_ref):
+        super().__init__()
+        # Hold a weak reference to avoid a reference cycle, which could
+        # otherwise cause this QObject to be deleted by the garbage
+        # collector in an arbitrary thread.
+        self._callback_ref = callback_ref
+
+    def customEvent(self, event):
+        callback = self._callback_ref()
+        if callback is not None:
+            callback()
+
+
 class _QiObjectImpl:
-    """Helper object to invoke callbacks on the Qt event loop."""
+    """Helper object to invoke callbacks on the Qt event loop.
 
-    def __init__(self):
+    Callbacks are invoked asynchronously in the thread that created this
+    object, so they are never invoked re-entrantly.  At most one
+    invocation is pending at any time; repeated calls to
+    invoke_callbacks() before the callbacks run are coalesced.
+    """
+
+    def __init__(self, priority: int = 0):
         # "Reuse" QtCore.QTimer.timeout as a parameterless signal.
         # Previous attempts to create a custom QObject with a custom signal
         # caused weird error with test_application_exited_during_loop under
         # (Python 3.7, macOS, PySide6).
         self._timer = QtCore.QTimer()
-
-    def add_callback(self, callback):
         # Make queued connection to avoid re-entrance.
         self._timer.timeout.connect(
-            callback, QtCore.Qt.ConnectionType.QueuedConnection)
+            self._on_invoked, QtCore.Qt.ConnectionType.QueuedConnection)
+        self._receiver: Optional[_QiEventReceiver] = None
+        self._callbacks = []
+        self._pending = False
+        self._priority = 0
+        self.set_priority(priority)
+
+    def set_priority(self, priority: int) -> None:
+        """Set the Qt event priority of subsequent invocations.
+
+        A queued signal (i.e. an event of normal priority) is the cheapest
+        way to invoke the callbacks, so an event is posted explicitly only
+        if a different priority is requested.
+        """
+        if priority != 0 and self._receiver is None:
+            self._receiver = _QiEventReceiver(
+                weakref.WeakMethod(self._on_invoked))
+        self._priority = priority
+
+    def add_callback(self, callback):
+        self._callbacks.append(callback)
 
     def remove_callback(self, callback):
-        self._timer.timeout.disconnect(callback)
+        self._callbacks.remove(callback)
 
     def invoke_callbacks(self):
-        self._timer.timeout.emit()
+        # This method may be called from any thread.
+        if self._pending:
+            return
+        self._pending = True
+        if self._priority == 0:
+            self._timer.timeout.emit()
+        else:
+            QtCore.QCoreApplication.postEvent(
+                self._receiver,
+                QtCore.QEvent(_QI_NOTIFY_EVENT_TYPE),
+                self._priority)
+
+    def _on_invoked(self):
+        # Clear the flag first so that a callback may invoke again.
+        self._pending = False
+        for callback in tuple(self._callbacks):
+            callback()
 
 
 class _QiSlotObject(QtCore.QObject):
@@ -0,0 +1,32 @@
+"""Helper script used by test_slot.py
+
+Connects a wrapped class method and exits, so that the wrapper is
+released at interpreter shutdown along with the class.
+"""
+
+import coverage
+coverage.process_startup()
+
+import sys
+import importlib
+import qtinter
+
+binding_name = sys.argv[1]
+QtCore = importlib.import_module(f"{binding_name}.QtCore")
+app = QtCore.QCoreApplication([])
+
+
+class Sender(QtCore.QObject):
+    signal = (QtCore.Signal if hasattr(QtCore, "Signal")
+              else QtCore.pyqtSignal)()
+
+
+class Receiver:
+    @classmethod
+    async def amethod(cls):
+        pass
+
+
+sender = Sender()
+sender.signal.connect(qtinter.asyncslot(Receiver.amethod))
+print("done")
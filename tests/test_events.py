@@ -104,6 +104,56 @@ class TestCtrlC(unittest.TestCase):
             loop.close()
 
 
+@unittest.skipIf(sys.version_info < (3, 8), 'requires python >= 3.8')
+class TestDeferredKI(unittest.TestCase):
+    # SIGINT received in the body of a function decorated with
+    # with_deferred_ki is deferred until raise_deferred_ki is called.
+
+    def setUp(self):
+        from qtinter._ki import enable_deferred_ki
+        self.assertTrue(enable_deferred_ki())
+
+    def tearDown(self):
+        from qtinter._ki import disable_deferred_ki
+        self.assertTrue(disable_deferred_ki())
+
+    def test_deferred(self):
+        from qtinter._ki import with_deferred_ki, raise_deferred_ki
+        steps = []
+
+        @with_deferred_ki
+        def fn():
+            signal.raise_signal(signal.SIGINT)
+            steps.append('deferred')
+            try:
+                raise_deferred_ki()
+            except KeyboardInterrupt:
+                steps.append('raised')
+            raise_deferred_ki()  # raised only once
+            steps.append('done')
+
+        fn()
+        self.assertEqual(steps, ['deferred', 'raised', 'done'])
+
+    def test_not_deferred_in_callee(self):
+        from qtinter._ki import with_deferred_ki, raise_deferred_ki
+
+        def callee():
+            signal.raise_signal(signal.SIGINT)
+
+        @with_deferred_ki
+        def fn():
+            raise_deferred_ki()
+            callee()
+
+        with self.assertRaises(KeyboardInterrupt):
+            fn()
+
+    def test_not_deferred_outside(self):
+        with self.assertRaises(KeyboardInterrupt):
+            signal.raise_signal(signal.SIGINT)
+
+
 @unittest.skipIf(sys.platform == 'win32', 'unix only')
 class TestUnixCtrlC(TestCtrlC):
     """Test Ctrl+C under unix."""
@@ -167,6 +217,12 @@ class TestUnixCtrlC(TestCtrlC):
         loop = qtinter.QiDefaultEventLoop()
         self._test_ctrl_c_suppressed_2(loop)
 
+    def test_socket_notifier_selector(self):
+        self._test_ctrl_c_while_selecting(qtinter.QiSelectorEventLoop(
+            qtinter.QiSocketNotifierSelector()))
+        self._test_ctrl_c_while_processing(qtinter.QiSelectorEventLoop(
+            qtinter.QiSocketNotifierSelector()))
+
 
 # The Windows Ctrl+C test is not run for Python 3.7, for two reasons:
 # - First, the proactor event loop in Python 3.7 does not support being
@@ -522,6 +578,140 @@ class TestSelectorEventLoop(unittest.TestCase):
         csock.close()
         ssock.close()
 
+    def test_timers_without_worker_thread(self):
+        # Waiting for timers alone should not involve the worker thread.
+        async def coro():
+            for _ in range(5):
+                await asyncio.sleep(0.01)
+
+        loop = qtinter.QiSelectorEventLoop()
+        try:
+            loop.run_until_complete(coro())
+            self.assertEqual(len(loop._selector._executor._threads), 0)
+        finally:
+            loop.close()
+
+    def test_add_reader_while_waiting_for_timer(self):
+        # Registering a reader while waiting for a timer on the Qt event
+        # loop should switch over to waiting in the worker thread.
+        import socket
+        csock, ssock = socket.socketpair()
+        received = []
+
+        def reader_callback():
+            received.append(csock.recv(1))
+            loop.stop()
+
+        async def coro():
+            await asyncio.sleep(10)
+
+        def add_reader():
+            loop.add_reader(csock, reader_callback)
+            QtCore.QTimer.singleShot(10, lambda: ssock.send(b'r'))
+
+        loop = qtinter.QiSelectorEventLoop()
+        task = loop.create_task(coro())
+        QtCore.QTimer.singleShot(10, add_reader)
+        try:
+            loop.run_forever()
+            task.cancel()
+            loop.run_until_complete(asyncio.gather(task, return_exceptions=True))
+        finally:
+            loop.close()
+            csock.close()
+            ssock.close()
+        self.assertEqual(received, [b'r'])
+
+    def test_add_reader_while_selecting(self):
+        # Registering a reader while the worker thread is in select()
+        # should return without waiting for select() to return.
+        import socket
+        csock, ssock = socket.socketpair()
+        rsock, wsock = socket.socketpair()
+        received = []
+        deferred = []
+
+        def reader_callback():
+            received.append(csock.recv(1))
+            loop.stop()
+
+        def add_reader():
+            deferred.append(not loop._selector._idle.is_set())
+            loop.add_reader(csock, reader_callback)
+            deferred.append(csock.fileno() in loop._selector._pending)
+            ssock.send(b'r')
+
+        loop = qtinter.QiSelectorEventLoop()
+        loop.add_reader(rsock, lambda: None)
+        QtCore.QTimer.singleShot(10, add_reader)
+        try:
+            loop.run_forever()
+            loop.remove_reader(rsock)
+        finally:
+            loop.close()
+            for sock in (csock, ssock, rsock, wsock):
+                sock.close()
+        self.assertEqual(deferred, [True, True])
+        self.assertEqual(received, [b'r'])
+
+    def test_remove_reader_while_selecting(self):
+        # A reader removed while the worker thread is in select() must not
+        # be called even if select() reports it ready.
+        import socket
+        csock, ssock = socket.socketpair()
+        received = []
+
+        def remove_reader():
+            loop.remove_reader(csock)
+            ssock.send(b'r')
+            QtCore.QTimer.singleShot(50, loop.stop)
+
+        loop = qtinter.QiSelectorEventLoop()
+        loop.add_reader(csock, lambda: received.append(csock.recv(1)))
+        QtCore.QTimer.singleShot(10, remove_reader)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+            csock.close()
+            ssock.close()
+        self.assertEqual(received, [])
+
+    def test_register_closed_fd_while_selecting(self):
+        # If a registration recorded while the worker thread is in
+        # select() cannot be applied later, the registration is dropped
+        # and the error reported to the exception handler; the loop keeps
+        # running.
+        import socket
+        csock, ssock = socket.socketpair()
+        rsock, wsock = socket.socketpair()
+        fd = csock.fileno()
+        called = []
+        contexts = []
+
+        def add_reader():
+            loop.add_reader(fd, lambda: called.append(True))
+            csock.close()
+            QtCore.QTimer.singleShot(50, loop.stop)
+
+        loop = qtinter.QiSelectorEventLoop()
+        loop.set_exception_handler(lambda loop, context:
+                                   contexts.append(context))
+        loop.add_reader(rsock, lambda: None)
+        QtCore.QTimer.singleShot(10, add_reader)
+        try:
+            loop.run_forever()
+            self.assertFalse(loop.remove_reader(fd))
+            loop.remove_reader(rsock)
+        finally:
+            loop.close()
+            for sock in (ssock, rsock, wsock):
+                sock.close()
+        self.assertEqual(called, [])
+        self.assertEqual(len(contexts), 1)
+        self.assertIsInstance(contexts[0]['exception'], OSError)
+        self.assertEqual(contexts[0]['fileobj'], fd)
+
     def test_close_when_running(self):
         async def coro():
             asyncio.get_running_loop().close()
@@ -533,6 +723,408 @@ class TestSelectorEventLoop(unittest.TestCase):
         loop.close()
 
 
+@unittest.skipIf(sys.platform == 'win32', 'unix only')
+class TestSocketNotifierSelector(unittest.TestCase):
+    def setUp(self):
+        if QtCore.QCoreApplication.instance() is not None:
+            self.app = QtCore.QCoreApplication.instance()
+        else:
+            self.app = QtCore.QCoreApplication([])
+
+    def tearDown(self):
+        self.app = None
+
+    def _new_event_loop(self):
+        return qtinter.QiSelectorEventLoop(qtinter.QiSocketNotifierSelector())
+
+    def test_selector_without_fileno(self):
+        import selectors
+        with self.assertRaisesRegex(TypeError, "pollable file descriptor"):
+            qtinter.QiSocketNotifierSelector(selectors.SelectSelector())
+
+    def test_reader_writer(self):
+        reader_flag = b''
+
+        import socket
+        csock, ssock = socket.socketpair()
+
+        def reader_callback():
+            nonlocal reader_flag
+            reader_flag = csock.recv(1)
+
+        def writer_callback():
+            csock.send(b'w')
+            loop.remove_writer(csock)
+
+        with qtinter.using_asyncio_from_qt(loop_factory=self._new_event_loop):
+            loop = asyncio.get_running_loop()
+            self.assertIsInstance(loop._selector,
+                                  qtinter.QiSocketNotifierSelector)
+            loop.add_reader(csock, reader_callback)
+            loop.add_writer(csock, writer_callback)
+
+            qt_loop = QtCore.QEventLoop()
+            QtCore.QTimer.singleShot(0, lambda: ssock.send(b'h'))
+            QtCore.QTimer.singleShot(10, qt_loop.quit)
+            exec_qt_loop(qt_loop)
+
+        self.assertEqual(reader_flag, b'h')
+        self.assertEqual(ssock.recv(10), b'w')
+        csock.close()
+        ssock.close()
+
+    def test_sleep(self):
+        async def coro():
+            t0 = loop.time()
+            await asyncio.sleep(0.1)
+            return loop.time() - t0
+
+        loop = self._new_event_loop()
+        try:
+            elapsed = loop.run_until_complete(coro())
+        finally:
+            loop.close()
+        self.assertGreaterEqual(elapsed, 0.1)
+        self.assertLess(elapsed, 0.5)
+
+    def test_call_soon_threadsafe(self):
+        async def coro():
+            fut = loop.create_future()
+            threading.Thread(
+                target=loop.call_soon_threadsafe,
+                args=(fut.set_result, 123)).start()
+            return await fut
+
+        loop = self._new_event_loop()
+        try:
+            self.assertEqual(loop.run_until_complete(coro()), 123)
+        finally:
+            loop.close()
+
+    def test_stop_from_interleaved_code(self):
+        loop = self._new_event_loop()
+        QtCore.QTimer.singleShot(100, loop.stop)
+        t0 = loop.time()
+        loop.run_forever()
+        t1 = loop.time()
+        loop.close()
+        self.assertTrue(t1 - t0 < 1, t1 - t0)
+
+
+class TestIterationBudget(unittest.TestCase):
+    def setUp(self):
+        if QtCore.QCoreApplication.instance() is not None:
+            self.app = QtCore.QCoreApplication.instance()
+        else:
+            self.app = QtCore.QCoreApplication([])
+
+    def tearDown(self):
+        self.app = None
+
+    def test_default_budget(self):
+        loop = qtinter.new_event_loop()
+        self.assertEqual(loop.get_iteration_budget(), 0)
+        loop.close()
+
+    def test_negative_budget(self):
+        loop = qtinter.new_event_loop()
+        with self.assertRaises(ValueError):
+            loop.set_iteration_budget(-1)
+        loop.close()
+
+    def test_callbacks_run_within_budget(self):
+        # With a generous budget, a chain of callbacks runs to completion
+        # without letting the Qt event loop in between.
+        steps = 0
+        observed = []
+
+        def step():
+            nonlocal steps
+            steps += 1
+            if steps < 100:
+                loop.call_soon(step)
+            else:
+                loop.stop()
+
+        def start():
+            QtCore.QTimer.singleShot(0, lambda: observed.append(steps))
+            loop.call_soon(step)
+
+        loop = qtinter.new_event_loop()
+        loop.set_iteration_budget(60.0)
+        loop.call_soon(start)
+        loop.run_forever()
+        QtCore.QCoreApplication.processEvents()
+        loop.close()
+        self.assertEqual(steps, 100)
+        self.assertEqual(observed, [100])
+
+    def test_stop_within_budget(self):
+        # stop() takes effect after the current iteration even if budget
+        # remains.
+        steps = 0
+
+        def step():
+            nonlocal steps
+            steps += 1
+            loop.call_soon(step)
+            if steps == 10:
+                loop.stop()
+
+        loop = qtinter.new_event_loop()
+        loop.set_iteration_budget(60.0)
+        loop.call_soon(step)
+        loop.run_forever()
+        loop.close()
+        self.assertEqual(steps, 10)
+
+    def test_modal_within_budget(self):
+        # exec_modal() interrupts the iteration even if budget remains.
+        output = []
+
+        async def coro():
+            output.append(1)
+            await qtinter.modal(output.append)(2)
+            output.append(3)
+
+        loop = qtinter.new_event_loop()
+        loop.set_iteration_budget(60.0)
+        loop.run_until_complete(coro())
+        loop.close()
+        self.assertEqual(output, [1, 2, 3])
+
+
+class TestLoopStats(unittest.TestCase):
+    def setUp(self):
+        if QtCore.QCoreApplication.instance() is not None:
+            self.app = QtCore.QCoreApplication.instance()
+        else:
+            self.app = QtCore.QCoreApplication([])
+
+    def tearDown(self):
+        self.app = None
+
+    def test_histogram(self):
+        h = qtinter.QiHistogram((1, 10))
+        for v in (0, 1, 2, 10, 11):
+            h.add(v)
+        self.assertEqual(h.counts, [2, 2, 1])
+        self.assertEqual(h.count, 5)
+        self.assertEqual(h.mean(), 24 / 5)
+        h.reset()
+        self.assertEqual(h.counts, [0, 0, 0])
+        self.assertEqual(h.mean(), 0)
+
+    def test_stats_disabled_by_default(self):
+        loop = qtinter.new_event_loop()
+        self.assertIsNone(loop.get_stats())
+        loop.close()
+
+    def test_collect_stats(self):
+        async def coro():
+            await asyncio.sleep(0.01)
+            await loop.run_in_executor(None, lambda: None)
+            for _ in range(10):
+                loop.call_soon(lambda: None)
+            await asyncio.sleep(0)
+
+        stats = qtinter.QiLoopStats()
+        loop = qtinter.new_event_loop()
+        loop.set_stats(stats)
+        self.assertIs(loop.get_stats(), stats)
+        try:
+            loop.run_until_complete(coro())
+        finally:
+            loop.close()
+
+        self.assertGreater(stats.iterations, 0)
+        self.assertGreater(stats.yields, 0)
+        self.assertGreater(stats.wakeups, 0)  # by run_in_executor
+        self.assertEqual(stats.select_time.count, stats.yields)
+        self.assertEqual(stats.notify_latency.count, stats.yields)
+        self.assertGreaterEqual(stats.select_time.total, 0.01)
+        self.assertEqual(stats.ready_depth.count, stats.iterations)
+        self.assertGreater(sum(stats.ready_depth.counts[5:]), 0)
+
+        stats.reset()
+        self.assertEqual(stats.iterations, 0)
+        self.assertEqual(stats.select_time.count, 0)
+
+    def test_stop_collecting(self):
+        stats = qtinter.QiLoopStats()
+        loop = qtinter.new_event_loop()
+        loop.set_stats(stats)
+
+        async def coro():
+            await asyncio.sleep(0)
+            loop.set_stats(None)
+            iterations = stats.iterations
+            await asyncio.sleep(0.01)
+            return iterations
+
+        try:
+            iterations = loop.run_until_complete(coro())
+        finally:
+            loop.close()
+        self.assertEqual(stats.iterations, iterations)
+        self.assertEqual(stats.yields, 0)
+
+    def test_coalesce_interleaved_wakeups(self):
+        # A Qt slot that schedules many callbacks while the loop is
+        # selecting wakes up the selector only once.
+        stats = qtinter.QiLoopStats()
+        loop = qtinter.new_event_loop()
+        loop.set_stats(stats)
+        called = []
+
+        def slot():
+            for i in range(1000):
+                loop.call_soon(called.append, i)
+            loop.call_soon(fut.set_result, None)
+
+        async def coro():
+            QtCore.QTimer.singleShot(0, slot)
+            await fut
+
+        try:
+            fut = loop.create_future()
+            loop.run_until_complete(coro())
+        finally:
+            loop.close()
+        self.assertEqual(called, list(range(1000)))
+        self.assertEqual(stats.wakeups, 1)
+
+    def test_coalesce_threadsafe_wakeups(self):
+        stats = qtinter.QiLoopStats()
+        loop = qtinter.new_event_loop()
+        loop.set_stats(stats)
+        called = []
+
+        def worker():
+            for i in range(1000):
+                loop.call_soon_threadsafe(called.append, i)
+            loop.call_soon_threadsafe(fut.set_result, None)
+
+        async def coro():
+            thread = threading.Thread(target=worker)
+            thread.start()
+            await fut
+            thread.join()
+
+        try:
+            fut = loop.create_future()
+            loop.run_until_complete(coro())
+        finally:
+            loop.close()
+        self.assertEqual(called, list(range(1000)))
+        self.assertGreater(stats.wakeups, 0)
+        self.assertLess(stats.wakeups, 1000)
+
+    def test_wakeup_while_draining(self):
+        # A wakeup written from another thread after select() returns but
+        # before the self-pipe is drained must not suppress later wakeups.
+        def noop():
+            pass
+
+        class Loop(qtinter.QiDefaultEventLoop):
+            racing = False
+
+            def _process_events(self, event_list):
+                super()._process_events(event_list)
+                if self.racing and event_list:
+                    # The self-pipe is readable and _read_from_self is
+                    # queued.  Schedule a callback that is run in this
+                    # iteration, together with its wakeup.
+                    self.racing = False
+                    thread = threading.Thread(
+                        target=self.call_soon_threadsafe, args=(noop,))
+                    thread.start()
+                    thread.join()
+
+        def worker():
+            time.sleep(0.1)
+            loop.call_soon_threadsafe(noop)  # wakes up for the race
+            time.sleep(0.1)
+            loop.call_soon_threadsafe(fut.set_result, None)
+
+        async def coro():
+            await asyncio.sleep(0)
+            loop.racing = True
+            thread = threading.Thread(target=worker)
+            thread.start()
+            t0 = time.perf_counter()
+            try:
+                await asyncio.wait_for(fut, 5)
+            finally:
+                thread.join()
+            self.assertFalse(loop.racing)
+            return time.perf_counter() - t0
+
+        loop = Loop()
+        try:
+            fut = loop.create_future()
+            elapsed = loop.run_until_complete(coro())
+        finally:
+            loop.close()
+        self.assertLess(elapsed, 2)
+
+
+class TestNotification(unittest.TestCase):
+    def setUp(self):
+        if QtCore.QCoreApplication.instance() is not None:
+            self.app = QtCore.QCoreApplication.instance()
+        else:
+            self.app = QtCore.QCoreApplication([])
+
+    def tearDown(self):
+        self.app = None
+
+    def test_coalesce(self):
+        # Repeated notifications before delivery are coalesced.
+        from qtinter.bindings import _QiObjectImpl
+        output = []
+        impl = _QiObjectImpl()
+        impl.add_callback(lambda: output.append(1))
+        impl.invoke_callbacks()
+        impl.invoke_callbacks()
+        impl.invoke_callbacks()
+        QtCore.QCoreApplication.processEvents()
+        self.assertEqual(output, [1])
+        impl.invoke_callbacks()
+        QtCore.QCoreApplication.processEvents()
+        self.assertEqual(output, [1, 1])
+
+    def test_priority(self):
+        # Notifications of higher priority are delivered first.
+        from qtinter.bindings import _QiObjectImpl
+        output = []
+        low = _QiObjectImpl()
+        low.add_callback(lambda: output.append('low'))
+        high = _QiObjectImpl()
+        high.set_priority(1)
+        high.add_callback(lambda: output.append('high'))
+        low.invoke_callbacks()
+        high.invoke_callbacks()
+        QtCore.QCoreApplication.processEvents()
+        self.assertEqual(output, ['high', 'low'])
+
+    def test_loop_notification_priority(self):
+        async def coro():
+            loop.set_notification_priority(-1)
+            await asyncio.sleep(0)
+            return loop.get_notification_priority()
+
+        loop = qtinter.new_event_loop()
+        self.assertEqual(loop.get_notification_priority(), 0)
+        loop.set_notification_priority(
+            QtCore.Qt.EventPriority.HighEventPriority)
+        self.assertEqual(loop.get_notification_priority(), 1)
+        try:
+            self.assertEqual(loop.run_until_complete(coro()), -1)
+        finally:
+            loop.close()
+
+
 class TestRunner(unittest.TestCase):
     def setUp(self):
         if QtCore.QCoreApplication.instance() is not None:
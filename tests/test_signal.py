@@ -1,7 +1,9 @@
 import asyncio
 import qtinter
 import unittest
-from shim import QtCore, Signal, exec_qt_loop
+import unittest.mock
+import weakref
+from shim import QtCore, Signal, exec_qt_loop, is_pyqt
 
 
 class SenderObject(QtCore.QObject):
@@ -66,6 +68,40 @@ class TestSignal(unittest.TestCase):
         with qtinter.using_qt_from_asyncio():
             self.assertEqual(asyncio.run(coro()), ("Hello", (1.5, "metre")))
 
+    def test_predicate(self):
+        # asyncsignal should only complete on an emission that matches
+        # the predicate, which sees the uncopied arguments.
+        sender = SenderObject()
+        seen = []
+
+        def predicate(value):
+            seen.append(value)
+            return value % 2 == 0
+
+        async def coro():
+            loop = asyncio.get_running_loop()
+            for value in (1, 3, 4, 6):
+                loop.call_soon(sender.signal1.emit, value)
+            return await qtinter.asyncsignal(sender.signal1,
+                                             predicate=predicate)
+
+        with qtinter.using_qt_from_asyncio():
+            self.assertEqual(asyncio.run(coro()), (4,))
+        self.assertEqual(seen, [1, 3, 4])
+
+    def test_predicate_raises(self):
+        # An exception raised by the predicate propagates to the awaiter.
+        sender = SenderObject()
+
+        async def coro():
+            asyncio.get_running_loop().call_soon(sender.signal1.emit, 0)
+            await qtinter.asyncsignal(sender.signal1,
+                                      predicate=lambda value: 1 / value)
+
+        with qtinter.using_qt_from_asyncio():
+            with self.assertRaises(ZeroDivisionError):
+                asyncio.run(coro())
+
     def test_cancellation(self):
         # asyncsignal should be able to be cancelled
         timer = QtCore.QTimer()
@@ -148,6 +184,24 @@ class TestSignal(unittest.TestCase):
             self.assertEqual(asyncio.run(coro()), "")
 
 
+class TestCopySignalArguments(unittest.TestCase):
+    def test_scalars_passed_through(self):
+        args = (None, True, 1, 1.5, 'str', b'bytes')
+        self.assertIs(qtinter._signals.copy_signal_arguments(args), args)
+
+    def test_qobject_passed_through(self):
+        obj = QtCore.QObject()
+        copied = qtinter._signals.copy_signal_arguments((1, obj))
+        self.assertIs(copied[1], obj)
+
+    def test_value_type_copied(self):
+        point = QtCore.QPoint(1, 2)
+        copied = qtinter._signals.copy_signal_arguments((1, point))
+        self.assertEqual(copied, (1, point))
+        if is_pyqt:
+            self.assertIsNot(copied[1], point)
+
+
 class TestAsyncSignalStream(unittest.TestCase):
     def setUp(self):
         if QtCore.QCoreApplication.instance() is not None:
@@ -178,6 +232,619 @@ class TestAsyncSignalStream(unittest.TestCase):
 
         self.assertTrue(0.9 < t2 - t1 < 1.5, t2 - t1)
 
+    def _collect(self, count, emit=range(1, 6), **kwargs):
+        # Emit values before consuming count of them from the stream.
+        sender = SenderObject()
+
+        async def coro():
+            stream = qtinter.asyncsignalstream(sender.signal1, **kwargs)
+            for value in emit:
+                sender.signal1.emit(value)
+            values = []
+            async for (value,) in stream:
+                values.append(value)
+                if len(values) == count:
+                    break
+            return values, stream.dropped
+
+        with qtinter.using_qt_from_asyncio():
+            return asyncio.run(coro())
+
+    def test_unbounded(self):
+        self.assertEqual(self._collect(5), ([1, 2, 3, 4, 5], 0))
+
+    def test_drop_oldest(self):
+        self.assertEqual(self._collect(2, maxsize=2), ([4, 5], 3))
+
+    def test_drop_newest(self):
+        self.assertEqual(self._collect(2, maxsize=2, overflow='drop_newest'),
+                         ([1, 2], 3))
+
+    def test_latest_only(self):
+        self.assertEqual(self._collect(1, overflow='latest_only'), ([5], 4))
+
+    def test_coalesce(self):
+        def reducer(pending, new):
+            return pending[0] + new[0],
+
+        self.assertEqual(
+            self._collect(2, maxsize=2, overflow='coalesce', reducer=reducer),
+            ([1, 14], 3))
+
+    def test_coalesce_reducer_raises(self):
+        # An exception raised by the reducer is raised to the consumer
+        # after the buffered emissions, and ends the stream.
+        def reducer(pending, new):
+            if new[0] == 4:
+                raise ValueError
+            return pending[0] + new[0],
+
+        sender = SenderObject()
+
+        async def coro():
+            stream = qtinter.asyncsignalstream(
+                sender.signal1, maxsize=2, overflow='coalesce',
+                reducer=reducer)
+            for value in range(1, 6):
+                sender.signal1.emit(value)
+            values = []
+            with self.assertRaises(ValueError):
+                async for (value,) in stream:
+                    values.append(value)
+            self.assertEqual(values, [1, 5])
+            with self.assertRaises(StopAsyncIteration):
+                await stream.__anext__()
+
+        with qtinter.using_qt_from_asyncio():
+            asyncio.run(coro())
+
+    def test_predicate(self):
+        # Rejected emissions are neither buffered nor counted as dropped.
+        self.assertEqual(
+            self._collect(2, maxsize=2, predicate=lambda value: value > 3),
+            ([4, 5], 0))
+
+    def test_predicate_raises(self):
+        # An exception raised by the predicate is raised to the consumer
+        # after the emissions buffered before it, and ends the stream.
+        sender = SenderObject()
+
+        async def coro():
+            stream = qtinter.asyncsignalstream(
+                sender.signal1, predicate=lambda value: 1 / value)
+            for value in (1, 2, 0, 3):
+                sender.signal1.emit(value)
+            values = []
+            with self.assertRaises(ZeroDivisionError):
+                async for (value,) in stream:
+                    values.append(value)
+            self.assertEqual(values, [1, 2])
+            with self.assertRaises(StopAsyncIteration):
+                await stream.__anext__()
+
+            # A pending consumer is woken up with the exception.
+            stream = qtinter.asyncsignalstream(
+                sender.signal1, predicate=lambda value: 1 / value)
+            asyncio.get_running_loop().call_soon(sender.signal1.emit, 0)
+            with self.assertRaises(ZeroDivisionError):
+                await stream.batches(max_items=2, max_latency=1).__anext__()
+
+        with qtinter.using_qt_from_asyncio():
+            asyncio.run(coro())
+
+    def test_zero_copy(self):
+        # QByteArray arguments are delivered as memoryview objects over
+        # a private copy, which the sender cannot modify.
+        sender = SenderObject()
+
+        async def coro():
+            stream = qtinter.asyncsignalstream(sender.signal2, zero_copy=True)
+            data = QtCore.QByteArray(b'abc')
+            sender.signal2.emit('x', data)
+            data.append(b'def')
+            (name, view), = await stream.batches().__anext__()
+            data.append(b'ghi')
+            return name, view
+
+        with qtinter.using_qt_from_asyncio():
+            name, view = asyncio.run(coro())
+        self.assertEqual(name, 'x')
+        self.assertIsInstance(view, memoryview)
+        self.assertEqual(bytes(view), b'abc')
+        self.assertIsInstance(view.obj, QtCore.QByteArray)
+
+    def _collect_batches(self, emit_later=(), interval=0.01, **kwargs):
+        # Emit 1 to 5 and then emit_later values (each interval seconds
+        # apart) while consuming batches, until all values are consumed.
+        sender = SenderObject()
+        expected = 5 + len(emit_later)
+
+        async def coro():
+            loop = asyncio.get_running_loop()
+            stream = qtinter.asyncsignalstream(sender.signal1)
+            for value in range(1, 6):
+                sender.signal1.emit(value)
+            for i, value in enumerate(emit_later):
+                loop.call_later(interval * (i + 1), sender.signal1.emit,
+                                value)
+            batches = []
+            async for batch in stream.batches(**kwargs):
+                batches.append([value for (value,) in batch])
+                if sum(map(len, batches)) == expected:
+                    break
+            return batches
+
+        with qtinter.using_qt_from_asyncio():
+            return asyncio.run(coro())
+
+    def test_batches(self):
+        self.assertEqual(self._collect_batches(), [[1, 2, 3, 4, 5]])
+
+    def test_batches_max_items(self):
+        self.assertEqual(self._collect_batches(max_items=2),
+                         [[1, 2], [3, 4], [5]])
+
+    def test_batches_max_latency(self):
+        # A batch waits for up to max_latency to fill up.
+        self.assertEqual(
+            self._collect_batches([6, 7, 8], max_items=7, max_latency=1),
+            [[1, 2, 3, 4, 5, 6, 7], [8]])
+
+    def test_batches_max_latency_expired(self):
+        # The late emission comes well after max_latency, even if the
+        # loop is slow to start consuming.
+        self.assertEqual(
+            self._collect_batches([6], interval=0.2, max_items=10,
+                                  max_latency=0.001),
+            [[1, 2, 3, 4, 5], [6]])
+
+    def test_batches_invalid_argument(self):
+        sender = SenderObject()
+        stream = qtinter.asyncsignalstream(sender.signal1)
+        with self.assertRaises(ValueError):
+            stream.batches(max_items=0)
+        with self.assertRaises(ValueError):
+            stream.batches(max_latency=-1)
+
+    def test_close(self):
+        sender = SenderObject()
+
+        async def coro():
+            stream = qtinter.asyncsignalstream(sender.signal1)
+            slot = weakref.ref(stream._slot)
+            sender.signal1.emit(1)
+            self.assertEqual(await stream.__anext__(), (1,))
+            getter = asyncio.ensure_future(stream.__anext__())
+            await asyncio.sleep(0)
+            sender.signal1.emit(2)
+            sender.signal1.emit(3)
+            await stream.aclose()
+            self.assertIsNone(slot())  # slot object deleted, disconnected
+            with self.assertRaises(StopAsyncIteration):
+                await getter  # buffered emissions are discarded
+            sender.signal1.emit(4)
+            self.assertEqual([args async for args in stream], [])
+            with self.assertRaises(StopAsyncIteration):
+                await stream.__anext__()
+            stream.close()  # no-op
+
+        with qtinter.using_qt_from_asyncio():
+            asyncio.run(coro())
+
+    def test_close_ends_pending_iteration(self):
+        sender = SenderObject()
+
+        async def coro():
+            stream = qtinter.asyncsignalstream(sender.signal1)
+            asyncio.get_running_loop().call_soon(stream.close)
+            return [args async for args in stream.batches()]
+
+        with qtinter.using_qt_from_asyncio():
+            self.assertEqual(asyncio.run(coro()), [])
+
+    def test_async_with(self):
+        sender = SenderObject()
+
+        async def coro():
+            async with qtinter.asyncsignalstream(sender.signal1) as stream:
+                sender.signal1.emit(1)
+                self.assertEqual(await stream.__anext__(), (1,))
+            self.assertIsNone(stream._slot)
+
+        with qtinter.using_qt_from_asyncio():
+            asyncio.run(coro())
+
+    def test_break_closes_stream(self):
+        sender = SenderObject()
+
+        async def coro():
+            stream = qtinter.asyncsignalstream(sender.signal1)
+            sender.signal1.emit(1)
+            sender.signal1.emit(2)
+            async for _ in stream:
+                break
+            # The abandoned async generator is closed by the loop.
+            for _ in range(3):
+                await asyncio.sleep(0)
+            self.assertIsNone(stream._slot)
+
+        with qtinter.using_qt_from_asyncio():
+            asyncio.run(coro())
+
+    def test_debug_counters(self):
+        sender = SenderObject()
+        counters = qtinter.asyncsignalstream.get_debug_counters()
+        stream = qtinter.asyncsignalstream(sender.signal1)
+        for value in range(3):
+            sender.signal1.emit(value)
+        self.assertEqual(qtinter.asyncsignalstream.get_debug_counters(), {
+            'streams': counters['streams'] + 1,
+            'queued': counters['queued'] + 3,
+        })
+        stream.close()
+        self.assertEqual(qtinter.asyncsignalstream.get_debug_counters(),
+                         counters)
+
+    def test_invalid_overflow(self):
+        sender = SenderObject()
+        with self.assertRaises(ValueError):
+            qtinter.asyncsignalstream(sender.signal1, overflow='drop_all')
+        with self.assertRaises(ValueError):
+            qtinter.asyncsignalstream(sender.signal1, overflow='coalesce')
+        with self.assertRaises(ValueError):
+            qtinter.asyncsignalstream(sender.signal1, reducer=max)
+        with self.assertRaises(ValueError):
+            qtinter.asyncsignalstream(sender.signal1, maxsize=2,
+                                      overflow='latest_only')
+
+    def test_stats(self):
+        sender = SenderObject()
+        stats = qtinter.QiSignalStats()
+
+        async def coro():
+            stream1 = qtinter.asyncsignalstream(sender.signal1)
+            stream2 = qtinter.asyncsignalstream(sender.signal1,
+                                                name='values')
+            sender.signal1.emit(1)
+            qtinter.set_signal_stats(stats)
+            try:
+                for value in range(2, 5):
+                    sender.signal1.emit(value)
+            finally:
+                qtinter.set_signal_stats(None)
+            stream1.close()
+            stream2.close()
+
+        with qtinter.using_qt_from_asyncio():
+            asyncio.run(coro())
+        # The default name is the signature, whose argument type name
+        # depends on the binding.
+        self.assertEqual(len(stats.streams), 2)
+        self.assertTrue(any(name.startswith('signal1(')
+                            for name in stats.streams))
+        stream_stats = stats.streams['values']
+        self.assertEqual(stream_stats.emissions, 3)
+        self.assertEqual(stream_stats.queue_depth.counts[1:4], [1, 1, 1])
+        self.assertGreater(stream_stats.rate(), 0)
+
+
+class TestSignalListener(unittest.TestCase):
+
+    def setUp(self) -> None:
+        if QtCore.QCoreApplication.instance() is not None:
+            self.app = QtCore.QCoreApplication.instance()
+        else:
+            self.app = QtCore.QCoreApplication([])
+
+    def tearDown(self) -> None:
+        self.app = None
+
+    def _run(self, coro):
+        with qtinter.using_qt_from_asyncio():
+            return asyncio.run(coro)
+
+    def test_wait_repeatedly(self):
+        sender = SenderObject()
+
+        async def coro():
+            loop = asyncio.get_running_loop()
+            values = []
+            with qtinter.SignalListener(sender.signal1) as listener:
+                for value in range(3):
+                    loop.call_soon(sender.signal1.emit, value)
+                    values.append(await listener.wait())
+            return values
+
+        self.assertEqual(self._run(coro()), [(0,), (1,), (2,)])
+
+    def test_unbuffered(self):
+        # Emissions while no wait() is pending are dropped.
+        sender = SenderObject()
+
+        async def coro():
+            listener = qtinter.SignalListener(sender.signal1)
+            sender.signal1.emit(1)
+            asyncio.get_running_loop().call_soon(sender.signal1.emit, 2)
+            return await listener.wait(), listener.dropped
+
+        self.assertEqual(self._run(coro()), ((2,), 1))
+
+    def test_buffered(self):
+        sender = SenderObject()
+
+        async def coro():
+            listener = qtinter.SignalListener(sender.signal1, buffered=True)
+            sender.signal1.emit(1)
+            sender.signal1.emit(2)
+            return await listener.wait(), await listener.wait()
+
+        self.assertEqual(self._run(coro()), ((1,), (2,)))
+
+    def test_predicate(self):
+        sender = SenderObject()
+
+        async def coro():
+            listener = qtinter.SignalListener(
+                sender.signal1, buffered=True, predicate=lambda v: v > 1)
+            sender.signal1.emit(1)
+            sender.signal1.emit(2)
+            return await listener.wait()
+
+        self.assertEqual(self._run(coro()), (2,))
+
+    def test_predicate_raises(self):
+        sender = SenderObject()
+
+        async def coro():
+            listener = qtinter.SignalListener(
+                sender.signal1, predicate=lambda value: 1 / value)
+            asyncio.get_running_loop().call_soon(sender.signal1.emit, 0)
+            with self.assertRaises(ZeroDivisionError):
+                await listener.wait()
+            with self.assertRaises(RuntimeError):
+                await listener.wait()
+
+        self._run(coro())
+
+    def test_timeout(self):
+        sender = SenderObject()
+
+        async def coro():
+            listener = qtinter.SignalListener(sender.signal1)
+            with self.assertRaises(asyncio.TimeoutError):
+                await listener.wait(0.05)
+            # The listener remains usable after a timeout.
+            asyncio.get_running_loop().call_soon(sender.signal1.emit, 1)
+            return await listener.wait(1)
+
+        self.assertEqual(self._run(coro()), (1,))
+
+    def test_close(self):
+        sender = SenderObject()
+
+        async def coro():
+            listener = qtinter.SignalListener(sender.signal1)
+            task = asyncio.create_task(listener.wait())
+            await asyncio.sleep(0)
+            listener.close()
+            with self.assertRaises(RuntimeError):
+                await task
+            # Closing disconnects from the signal.
+            sender.signal1.emit(1)
+            self.assertEqual(listener.dropped, 0)
+            with self.assertRaises(RuntimeError):
+                await listener.wait()
+
+        self._run(coro())
+
+    def test_listener_deleted(self):
+        # Deleting the listener closes the connection.
+        sender = SenderObject()
+
+        async def coro():
+            listener = qtinter.SignalListener(sender.signal1)
+            ref = weakref.ref(listener._buffer)
+            listener = None
+            return ref()
+
+        self.assertIsNone(self._run(coro()))
+
+
+class TestRateLimiting(unittest.TestCase):
+
+    def setUp(self) -> None:
+        if QtCore.QCoreApplication.instance() is not None:
+            self.app = QtCore.QCoreApplication.instance()
+        else:
+            self.app = QtCore.QCoreApplication([])
+
+    def tearDown(self) -> None:
+        self.app = None
+
+    def _collect(self, make, bursts):
+        # Emit each burst of values at once, 200 ms apart, through the
+        # signal-like object returned by make, and collect what passes.
+        sender = SenderObject()
+        received = []
+
+        async def coro():
+            limited = make(sender.signal1)
+            limited.connect(lambda value: received.append(value))
+            for burst in bursts:
+                for value in burst:
+                    sender.signal1.emit(value)
+                await asyncio.sleep(0.2)
+
+        with qtinter.using_qt_from_asyncio():
+            asyncio.run(coro())
+        return received
+
+    def test_debounce(self):
+        self.assertEqual(
+            self._collect(lambda s: qtinter.debounce(s, 50),
+                          [(1, 2, 3), (4,), ()]),
+            [3, 4])
+
+    def test_throttle(self):
+        self.assertEqual(
+            self._collect(lambda s: qtinter.throttle(s, 50),
+                          [(1, 2, 3), (4,)]),
+            [1, 3, 4])
+
+    def test_throttle_leading_only(self):
+        self.assertEqual(
+            self._collect(lambda s: qtinter.throttle(s, 50, trailing=False),
+                          [(1, 2, 3), (4,)]),
+            [1, 4])
+
+    def test_throttle_trailing_only(self):
+        self.assertEqual(
+            self._collect(lambda s: qtinter.throttle(s, 50, leading=False),
+                          [(1, 2, 3), (4,)]),
+            [3, 4])
+
+    def test_throttle_leading_not_copied(self):
+        # Emissions passed on immediately are not copied, and no
+        # arguments are retained once an emission is passed on.
+        from qtinter import _signals
+        with unittest.mock.patch.object(
+                _signals, 'copy_signal_arguments',
+                wraps=_signals.copy_signal_arguments) as copy:
+            self.assertEqual(
+                self._collect(
+                    lambda s: qtinter.throttle(s, 50, trailing=False),
+                    [(1, 2, 3), (4,)]),
+                [1, 4])
+        self.assertEqual(copy.call_count, 0)
+
+        sender = SenderObject()
+        throttled = qtinter.throttle(sender.signal1, 50)
+        throttled.connect(lambda value: None)
+        sender.signal1.emit(1)
+        self.assertEqual(throttled._state.args, ())
+
+    def test_invalid_argument(self):
+        sender = SenderObject()
+        with self.assertRaises(ValueError):
+            qtinter.debounce(sender.signal1, -1)
+        with self.assertRaises(ValueError):
+            qtinter.throttle(sender.signal1, 50, leading=False,
+                             trailing=False)
+
+    def test_asyncsignal(self):
+        sender = SenderObject()
+
+        async def coro():
+            loop = asyncio.get_running_loop()
+            for value in range(3):
+                loop.call_soon(sender.signal1.emit, value)
+            return await qtinter.asyncsignal(
+                qtinter.debounce(sender.signal1, 10))
+
+        with qtinter.using_qt_from_asyncio():
+            self.assertEqual(asyncio.run(coro()), (2,))
+
+    def test_asyncslot(self):
+        sender = SenderObject()
+        result = []
+
+        async def handler(value):
+            result.append(value)
+
+        async def coro():
+            debounced = qtinter.debounce(sender.signal1, 10)
+            debounced.connect(qtinter.asyncslot(handler))
+            sender.signal1.emit(1)
+            sender.signal1.emit(2)
+            await asyncio.sleep(0.1)
+
+        with qtinter.using_qt_from_asyncio():
+            asyncio.run(coro())
+        self.assertEqual(result, [2])
+
+    def test_multisignal(self):
+        sender = SenderObject()
+
+        async def coro():
+            throttled = qtinter.throttle(sender.signal1, 1000)
+            ms = qtinter.multisignal({throttled: 'a', sender.signal0: 'b'})
+            asyncio.get_running_loop().call_soon(sender.signal1.emit, 1)
+            return await qtinter.asyncsignal(ms)
+
+        with qtinter.using_qt_from_asyncio():
+            self.assertEqual(asyncio.run(coro()), ('a', (1,)))
+
+
+class TestSelectSignals(unittest.TestCase):
+
+    def setUp(self) -> None:
+        if QtCore.QCoreApplication.instance() is not None:
+            self.app = QtCore.QCoreApplication.instance()
+        else:
+            self.app = QtCore.QCoreApplication([])
+
+    def tearDown(self) -> None:
+        self.app = None
+
+    def _run(self, coro):
+        with qtinter.using_qt_from_asyncio():
+            return asyncio.run(coro)
+
+    def _count_ports(self):
+        return sum(map(len, qtinter._signals._multisignal_ports.values()))
+
+    def test_first_emission(self):
+        sender = SenderObject()
+        timer = QtCore.QTimer()
+        timer.setInterval(1000)
+        timer.start()
+
+        async def coro():
+            asyncio.get_running_loop().call_soon(
+                sender.signal2.emit, 'x', None)
+            return await qtinter.select_signals({
+                timer.timeout: 'timeout',
+                sender.signal1: 1,
+                sender.signal2: 2,
+            })
+
+        initial = self._count_ports()
+        self.assertEqual(self._run(coro()), (2, ('x', None)))
+        # Every signal is disconnected from.
+        self.assertEqual(self._count_ports(), initial)
+
+    def test_timeout(self):
+        sender = SenderObject()
+
+        async def coro():
+            await qtinter.select_signals(
+                {sender.signal0: 0, sender.signal1: 1}, timeout=0.05)
+
+        initial = self._count_ports()
+        with self.assertRaises(asyncio.TimeoutError):
+            self._run(coro())
+        self.assertEqual(self._count_ports(), initial)
+
+    def test_cancellation(self):
+        sender = SenderObject()
+
+        async def coro():
+            task = asyncio.create_task(
+                qtinter.select_signals({sender.signal0: 0}))
+            await asyncio.sleep(0)
+            task.cancel()
+            sender.signal0.emit()
+            await task
+
+        initial = self._count_ports()
+        with self.assertRaises(asyncio.CancelledError):
+            self._run(coro())
+        self.assertEqual(self._count_ports(), initial)
+
+    def test_empty_map(self):
+        with self.assertRaises(ValueError):
+            self._run(qtinter.select_signals({}))
+
 
 class TestMultiSignal(unittest.TestCase):
     def setUp(self):
@@ -215,6 +882,99 @@ class TestMultiSignal(unittest.TestCase):
 
         self.assertEqual(result, [('A', ()), ('A', ()), (4, ())])
 
+    def test_signals_of_same_sender(self):
+        sender = SenderObject()
+        ms = qtinter.multisignal({
+            sender.signal0: 0,
+            sender.signal1: 1,
+            sender.signal2: 2,
+        })
+        result = []
+        ms.connect(lambda tag, args: result.append((tag, args)))
+        sender.signal2.emit('x', None)
+        sender.signal0.emit()
+        sender.signal1.emit(5)
+        self.assertEqual(result, [(2, ('x', None)), (0, ()), (1, (5,))])
+
+    def _count_ports(self):
+        return sum(map(len, qtinter._signals._multisignal_ports.values()))
+
+    def test_receiver_deleted(self):
+        # The connections are closed when the receiver of a bound method
+        # slot is deleted.
+        class Receiver:
+            def __init__(self):
+                self.result = []
+
+            def slot(self, tag, args):
+                self.result.append((tag, args))
+
+        sender = SenderObject()
+        initial = self._count_ports()
+        receiver = Receiver()
+        qtinter.multisignal({sender.signal0: 'a', sender.signal1: 'b'}) \
+            .connect(receiver.slot)
+        self.assertEqual(self._count_ports(), initial + 2)
+        sender.signal1.emit(1)
+        self.assertEqual(receiver.result, [('b', (1,))])
+
+        receiver = None
+        self.assertEqual(self._count_ports(), initial)
+        sender.signal0.emit()
+        sender.signal1.emit(2)
+
+    def test_asyncsignal(self):
+        sender = SenderObject()
+        ms = qtinter.multisignal({sender.signal0: 'a', sender.signal1: 'b'})
+
+        async def coro():
+            asyncio.get_running_loop().call_soon(sender.signal1.emit, 1)
+            return await qtinter.asyncsignal(ms)
+
+        initial = self._count_ports()
+        with qtinter.using_qt_from_asyncio():
+            self.assertEqual(asyncio.run(coro()), ('b', (1,)))
+        self.assertEqual(self._count_ports(), initial)
+
+    def test_stats(self):
+        sender = SenderObject()
+        stats = qtinter.QiSignalStats()
+        qtinter.multisignal({sender.signal0: 0, sender.signal1: 'b'},
+                            name='ms').connect(lambda tag, args: None)
+        qtinter.set_signal_stats(stats)
+        try:
+            sender.signal0.emit()
+            sender.signal1.emit(1)
+            sender.signal1.emit(2)
+        finally:
+            qtinter.set_signal_stats(None)
+        self.assertEqual(stats.streams['ms[0]'].emissions, 1)
+        self.assertEqual(stats.streams["ms['b']"].emissions, 2)
+
+    def test_stream_name(self):
+        # A stream over a signal-like object is named after the object.
+        sender = SenderObject()
+        stats = qtinter.QiSignalStats()
+
+        async def coro():
+            ms = qtinter.multisignal({sender.signal0: 0}, name='ms')
+            debounced = qtinter.debounce(sender.signal0, 10)
+            streams = [qtinter.asyncsignalstream(ms),
+                       qtinter.asyncsignalstream(debounced)]
+            qtinter.set_signal_stats(stats)
+            try:
+                sender.signal0.emit()
+                await asyncio.sleep(0.1)
+            finally:
+                qtinter.set_signal_stats(None)
+            for stream in streams:
+                stream.close()
+
+        with qtinter.using_qt_from_asyncio():
+            asyncio.run(coro())
+        self.assertEqual(stats.streams['ms'].emissions, 1)
+        self.assertEqual(stats.streams['debounce(signal0())'].emissions, 1)
+
 
 if __name__ == "__main__":
     unittest.main()
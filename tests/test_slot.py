@@ -1,9 +1,16 @@
 """ test_slot.py - test the asyncslot() function """
 
 import asyncio
+import gc
+import os
 import sys
+import types
 import unittest
-from shim import QtCore, Signal, Slot, is_pyqt
+import unittest.mock
+import warnings
+import weakref
+import qtinter
+from shim import QtCore, Signal, Slot, is_pyqt, run_test_script
 from qtinter import asyncslot, using_asyncio_from_qt
 
 
@@ -512,6 +519,41 @@ class TestSlotBehavior(unittest.TestCase):
             # expecting change, because connection is still alive
             self.assertEqual(output[0], 9)
 
+    @unittest.skipIf(sys.version_info < (3, 12), "requires Python >= 3.12")
+    def test_native_eager_start(self):
+        # The Task constructor runs the slot body synchronously within
+        # emit() up to its first await, as the current task, instead of
+        # asyncio.create_task() scheduling it.
+        sender = IntSender()
+        steps = []
+
+        async def slot(value):
+            steps.append((value, asyncio.current_task()))
+            if value:
+                await asyncio.sleep(0)
+                steps.append('resumed')
+
+        async def entry():
+            outer = asyncio.current_task()
+            sender.signal.connect(asyncslot(slot))
+            with unittest.mock.patch.object(
+                    asyncio, 'create_task', side_effect=AssertionError):
+                sender.signal.emit(0)
+                self.assertEqual(len(steps), 1)
+                self.assertTrue(steps[0][1].done())
+
+                sender.signal.emit(1)
+                self.assertEqual(len(steps), 2)
+                task = steps[1][1]
+                self.assertIsNot(task, outer)
+                self.assertFalse(task.done())
+                self.assertIs(asyncio.current_task(), outer)
+            await task
+            self.assertEqual(steps[2:], ['resumed'])
+
+        with qtinter.using_qt_from_asyncio():
+            asyncio.run(entry())
+
     def test_await(self):
         # asyncslot returns a Task object and so can be awaited.
 
@@ -540,6 +582,61 @@ class TestSlotBehavior(unittest.TestCase):
 
         self.assertEqual(counter, 5)
 
+    def test_parameter_count_cached(self):
+        # Functions sharing the same code object but differing in
+        # keyword-only defaults or bound-ness are told apart by the
+        # parameter count cache.
+        from qtinter._helpers import get_positional_parameter_count
+
+        def make(**kwdefaults):
+            async def f(a, *, b): pass
+            f.__kwdefaults__ = kwdefaults or None
+            return f
+
+        for _ in range(2):
+            with self.assertRaisesRegex(TypeError, "'b' without default"):
+                get_positional_parameter_count(make())
+        self.assertEqual(get_positional_parameter_count(make(b=1)), 1)
+        self.assertEqual(get_positional_parameter_count(
+            types.MethodType(make(b=1), object())), 0)
+
+    def test_wrapper_class_cached(self):
+        # Wrappers of the same method of different receivers share the
+        # same wrapper class.
+        receiver1 = IntReceiver([1])
+        receiver2 = IntReceiver([1])
+        slot1 = asyncslot(receiver1.original_slot)
+        slot2 = asyncslot(receiver2.original_slot)
+        self.assertIsNot(slot1.__self__, slot2.__self__)
+        self.assertIs(type(slot1.__self__), type(slot2.__self__))
+        self.assertEqual(slot1.__name__, 'original_slot')
+
+    def test_released_at_shutdown(self):
+        # A wrapper released at interpreter shutdown, along with the
+        # class of its receiver, does not report an error.
+        rc, out, err = run_test_script(
+            "slot_shutdown.py", os.getenv("TEST_QT_MODULE"),
+            QTINTERBINDING=os.getenv("TEST_QT_MODULE"))
+        self.assertEqual(rc, 0)
+        self.assertEqual(out.rstrip(), "done")
+        self.assertNotIn("Exception ignored", err)
+
+    def test_rewrapped_method_kept_alive(self):
+        # Wrapping a method again after a previous wrapper was released
+        # returns a new wrapper that keeps the receiver alive.
+        output = [1]
+        sender = IntSender()
+        receiver = IntReceiver(output)
+        wrapper = weakref.ref(asyncslot(receiver.original_slot).__self__)
+        self.assertIsNotNone(wrapper())
+        the_slot = asyncslot(receiver.original_slot)
+        self.assertIsNot(the_slot.__self__, wrapper())
+        with using_asyncio_from_qt():
+            sender.signal.connect(the_slot)
+            receiver = None
+            sender.signal.emit(3)
+            self.assertEqual(output[0], 4)
+
     def test_strong_receiver(self):
         # Test connecting to a bounded method of an object that does not
         # support weak reference.
@@ -554,6 +651,314 @@ class TestSlotBehavior(unittest.TestCase):
             with self.assertRaises(TypeError):
                 sender.signal.connect(asyncslot(receiver.amethod))
 
+    @unittest.skipIf(sys.version_info < (3, 8), "requires Python >= 3.8")
+    def test_strong_receiver_no_finalizer_error(self):
+        # A wrapper that fails to construct must not raise from __del__.
+        unraisable = []
+        receiver = StrongReceiver([])
+        old_hook = sys.unraisablehook
+        sys.unraisablehook = unraisable.append
+        try:
+            with self.assertRaises(TypeError):
+                asyncslot(receiver.amethod)
+            gc.collect()
+        finally:
+            sys.unraisablehook = old_hook
+        self.assertEqual(unraisable, [])
+
+
+class Worker:
+    def __init__(self):
+        self.started = []
+        self.finished = []
+        self.running = 0
+        self.max_running = 0
+
+    async def work(self, value):
+        self.started.append(value)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.running -= 1
+        self.finished.append(value)
+
+
+class TestConcurrencyPolicy(unittest.TestCase):
+
+    def setUp(self):
+        if QtCore.QCoreApplication.instance() is not None:
+            self.app = QtCore.QCoreApplication.instance()
+        else:
+            self.app = QtCore.QCoreApplication([])
+
+    def tearDown(self):
+        self.app = None
+
+    def _call(self, worker, values, **kwargs):
+        # Call an asyncslot wrapper of worker.work with each value in
+        # turn, wait for all tasks to finish and return the results of
+        # the calls.
+        async def coro():
+            slot = asyncslot(worker.work, **kwargs)
+            results = [slot(value) for value in values]
+            idle = 0
+            while idle < 2:
+                # Let done callbacks start any queued call.
+                await asyncio.sleep(0.01)
+                if len(asyncio.all_tasks()) > 1:
+                    idle = 0
+                else:
+                    idle += 1
+            return results
+
+        with qtinter.using_qt_from_asyncio():
+            return asyncio.run(coro())
+
+    def test_drop_while_running(self):
+        worker = Worker()
+        results = self._call(worker, [1, 2, 3], policy='drop_while_running')
+        self.assertIsInstance(results[0], asyncio.Task)
+        self.assertEqual(results[1:], [None, None])
+        self.assertEqual(worker.finished, [1])
+
+    def test_queue(self):
+        worker = Worker()
+        results = self._call(worker, [1, 2, 3, 4], policy='queue',
+                             max_queued=2)
+        self.assertEqual(results[1:], [None, None, None])
+        self.assertEqual(worker.finished, [1, 2, 3])
+        self.assertEqual(worker.max_running, 1)
+
+    def test_restart(self):
+        worker = Worker()
+        results = self._call(worker, [1, 2, 3], policy='restart')
+        self.assertTrue(results[0].cancelled())
+        self.assertTrue(results[1].cancelled())
+        self.assertEqual(worker.started, [1, 2, 3])
+        self.assertEqual(worker.finished, [3])
+
+    def test_max_concurrency(self):
+        worker = Worker()
+        self._call(worker, range(5), policy='queue', max_concurrency=2)
+        self.assertEqual(worker.finished, [0, 1, 2, 3, 4])
+        self.assertEqual(worker.max_running, 2)
+
+    def test_shared_by_receiver(self):
+        # Wrappers of the same method of the same receiver share state.
+        worker = Worker()
+
+        async def coro():
+            slot1 = asyncslot(worker.work, policy='drop_while_running')
+            slot2 = asyncslot(worker.work, policy='drop_while_running')
+            return slot1(1), slot2(2), \
+                asyncslot(Worker().work, policy='drop_while_running')(3)
+
+        with qtinter.using_qt_from_asyncio():
+            task1, task2, task3 = asyncio.run(coro())
+        self.assertIsNotNone(task1)
+        self.assertIsNone(task2)
+        self.assertIsNotNone(task3)
+
+    def test_invalid_argument(self):
+        worker = Worker()
+        with self.assertRaises(ValueError):
+            asyncslot(worker.work, policy='unknown')
+        with self.assertRaises(ValueError):
+            asyncslot(worker.work, max_concurrency=2)
+        with self.assertRaises(ValueError):
+            asyncslot(worker.work, policy='queue', max_concurrency=0)
+        with self.assertRaises(ValueError):
+            asyncslot(worker.work, policy='restart', max_queued=1)
+
+
+class TestTaskScope(unittest.TestCase):
+
+    def setUp(self):
+        if QtCore.QCoreApplication.instance() is not None:
+            self.app = QtCore.QCoreApplication.instance()
+        else:
+            self.app = QtCore.QCoreApplication([])
+
+    def tearDown(self):
+        self.app = None
+
+    def test_cancel_on_destroyed(self):
+        worker = Worker()
+
+        async def coro():
+            owner = QtCore.QObject()
+            scope = qtinter.TaskScope(owner)
+            slot = asyncslot(worker.work, scope=scope)
+            task1 = slot(1)
+            task2 = scope.create_task(worker.work(2))
+            self.assertEqual(len(scope), 2)
+            self.assertFalse(scope.closed)
+
+            owner = None
+            self.assertTrue(scope.closed)
+            self.assertEqual(scope.cancelled, 2)
+            task3 = slot(3)
+            await asyncio.gather(task1, task2, task3,
+                                 return_exceptions=True)
+            return scope, task1, task2, task3
+
+        with qtinter.using_qt_from_asyncio():
+            scope, task1, task2, task3 = asyncio.run(coro())
+        self.assertTrue(task1.cancelled())
+        self.assertTrue(task2.cancelled())
+        self.assertTrue(task3.cancelled())
+        # Task 2 was cancelled before it started, task 3 was never run.
+        self.assertEqual(worker.started, [1])
+        self.assertEqual(worker.finished, [])
+        self.assertEqual(scope.cancelled, 3)
+        self.assertEqual(len(scope), 0)
+
+    def test_completed_tasks_removed(self):
+        worker = Worker()
+
+        async def coro():
+            owner = QtCore.QObject()
+            scope = qtinter.TaskScope(owner)
+            await asyncslot(worker.work, scope=scope)(1)
+            await asyncio.sleep(0)
+            self.assertEqual(len(scope), 0)
+            self.assertEqual(scope.cancel(), 0)
+            return owner, scope
+
+        with qtinter.using_qt_from_asyncio():
+            owner, scope = asyncio.run(coro())
+        self.assertEqual(worker.finished, [1])
+        self.assertEqual(scope.cancelled, 0)
+
+    def test_scope_kept_by_tasks(self):
+        # A member task keeps the scope alive.
+        worker = Worker()
+
+        async def coro():
+            owner = QtCore.QObject()
+            task = qtinter.TaskScope(owner).create_task(worker.work(1))
+            await asyncio.sleep(0)
+            owner = None
+            await asyncio.gather(task, return_exceptions=True)
+            return task
+
+        with qtinter.using_qt_from_asyncio():
+            task = asyncio.run(coro())
+        self.assertTrue(task.cancelled())
+        self.assertEqual(worker.started, [1])
+
+    def test_lifetime(self):
+        # Neither the scope nor its QObject keeps the other alive.
+        owner = QtCore.QObject()
+        scope = qtinter.TaskScope(owner)
+        owner_ref = weakref.ref(owner)
+        owner = None
+        self.assertIsNone(owner_ref())
+        self.assertTrue(scope.closed)
+
+        owner = QtCore.QObject()
+        scope_ref = weakref.ref(qtinter.TaskScope(owner))
+        self.assertIsNone(scope_ref())
+        owner = None
+
+
+class TestSlotStats(unittest.TestCase):
+
+    def setUp(self):
+        if QtCore.QCoreApplication.instance() is not None:
+            self.app = QtCore.QCoreApplication.instance()
+        else:
+            self.app = QtCore.QCoreApplication([])
+        self.stats = qtinter.QiSignalStats()
+        qtinter.set_signal_stats(self.stats)
+
+    def tearDown(self):
+        qtinter.set_signal_stats(None)
+        self.app = None
+
+    def test_disabled_by_default(self):
+        qtinter.set_signal_stats(None)
+        self.assertIsNone(qtinter.get_signal_stats())
+        worker = Worker()
+
+        async def coro():
+            await asyncslot(worker.work)(1)
+
+        with qtinter.using_qt_from_asyncio():
+            asyncio.run(coro())
+        self.assertEqual(worker.finished, [1])
+        self.assertEqual(self.stats.slots, {})
+
+    def test_collect_stats(self):
+        worker = Worker()
+
+        async def fail():
+            raise ValueError
+
+        async def coro():
+            slot = asyncslot(worker.work)
+            task1 = slot(1)
+            task2 = slot(2)
+            self.assertEqual(self.stats.slots['Worker.work'].in_flight, 2)
+            task2.cancel()
+            task3 = asyncslot(fail)()
+            await asyncio.wait([task1, task2, task3])
+            await asyncio.sleep(0)  # let done callbacks run
+            with self.assertRaises(ValueError):
+                task3.result()
+
+        self.assertIs(qtinter.get_signal_stats(), self.stats)
+        with qtinter.using_qt_from_asyncio():
+            asyncio.run(coro())
+
+        stats = self.stats.slots['Worker.work']
+        self.assertEqual(stats.invocations, 2)
+        self.assertEqual(stats.in_flight, 0)
+        self.assertEqual(stats.cancelled, 1)
+        self.assertEqual(stats.exceptions, 0)
+        self.assertEqual(stats.eager_time.count, 2)
+        self.assertEqual(stats.task_time.count, 2)
+        self.assertGreaterEqual(stats.task_time.total, 0.01)
+
+        name = 'TestSlotStats.test_collect_stats.<locals>.fail'
+        stats = self.stats.slots[name]
+        self.assertEqual(stats.invocations, 1)
+        self.assertEqual(stats.cancelled, 0)
+        self.assertEqual(stats.exceptions, 1)
+        self.assertIn(name, self.stats.summary())
+
+        self.stats.reset()
+        self.assertEqual(stats.invocations, 0)
+        self.assertEqual(stats.task_time.count, 0)
+
+    def test_cancelled_before_start(self):
+        # A slot task that never runs, because its scope is closed, must
+        # not leave a never-awaited coroutine behind.
+        worker = Worker()
+
+        async def coro():
+            owner = QtCore.QObject()
+            scope = qtinter.TaskScope(owner)
+            owner = None
+            task = asyncslot(worker.work, scope=scope)(1)
+            await asyncio.gather(task, return_exceptions=True)
+            await asyncio.sleep(0)  # let done callbacks run
+            return task
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            with qtinter.using_qt_from_asyncio():
+                task = asyncio.run(coro())
+            task = None
+            gc.collect()
+        self.assertEqual([str(w.message) for w in caught], [])
+        self.assertEqual(worker.started, [])
+        stats = self.stats.slots['Worker.work']
+        self.assertEqual(stats.cancelled, 1)
+        self.assertEqual(stats.in_flight, 0)
+
 
 # =============================================================================
 # Test signal override by parameter type
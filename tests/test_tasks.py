@@ -154,6 +154,62 @@ class TestRunTask(unittest.TestCase):
 
         self.loop.run_until_complete(entry())
 
+    def test_current_task(self):
+        # The created task is the current task during its first step, and
+        # the calling task is the current task again afterwards.
+        async def coro(output):
+            output.append(asyncio.current_task())
+            await asyncio.sleep(0)
+
+        async def entry():
+            output = []
+            task = qtinter.run_task(coro(output))
+            self.assertEqual(output, [task])
+            self.assertIs(asyncio.current_task(), outer)
+            await task
+
+        outer = self.loop.create_task(entry())
+        self.loop.run_until_complete(outer)
+
+    def test_custom_task_factory(self):
+        # run_task should create the task with the loop's task factory.
+        created = []
+
+        def factory(loop, coro, **kwargs):
+            task = asyncio.Task(coro, loop=loop, **kwargs)
+            created.append(task)
+            return task
+
+        async def coro(output):
+            output.append(1)
+            await asyncio.sleep(0)
+
+        async def entry():
+            output = []
+            task = qtinter.run_task(coro(output))
+            self.assertEqual(output, [1])
+            self.assertEqual(created[-1], task)
+            await task
+
+        self.loop.set_task_factory(factory)
+        self.loop.run_until_complete(entry())
+
+    @unittest.skipIf(sys.version_info < (3, 12), "requires Python >= 3.12")
+    def test_native_eager_start(self):
+        # A coroutine that completes in its first step is not scheduled.
+        async def coro():
+            return 'finished'
+
+        async def entry():
+            ready = len(self.loop._ready)
+            task = qtinter.run_task(coro())
+            self.assertTrue(task.done())
+            self.assertEqual(len(self.loop._ready), ready)
+            return task.result()
+
+        result = self.loop.run_until_complete(entry())
+        self.assertEqual(result, 'finished')
+
     def test_disallow_nesting(self):
         # If task nesting is disabled, raise RuntimeError
         # run_task should support task name.